@@ -13,6 +13,7 @@ This module is service-agnostic and can be used by any assistant skills library.
 from __future__ import annotations
 
 import json
+import os
 import time
 from collections.abc import Callable
 from dataclasses import asdict, dataclass, field
@@ -84,12 +85,12 @@ class BatchConfig:
 class CheckpointManager:
     """Manages checkpoints for resumable operations."""
 
-    def __init__(self, checkpoint_dir: str, operation_id: str):
+    def __init__(self, checkpoint_dir: str | os.PathLike[str], operation_id: str):
         """
         Initialize checkpoint manager.
 
         Args:
-            checkpoint_dir: Directory to store checkpoint files
+            checkpoint_dir: Directory to store checkpoint files (str or path-like)
             operation_id: Unique identifier for this operation
         """
         self.checkpoint_dir = Path(checkpoint_dir)
@@ -341,19 +342,19 @@ def generate_operation_id(
 
 
 def list_pending_checkpoints(
-    checkpoint_dir: str | None = None,
+    checkpoint_dir: str | os.PathLike[str] | None = None,
 ) -> list[dict[str, Any]]:
     """
     List all pending checkpoints that can be resumed.
 
     Args:
-        checkpoint_dir: Directory containing checkpoints
+        checkpoint_dir: Directory containing checkpoints (str or path-like)
 
     Returns:
         List of checkpoint info dicts
     """
     if checkpoint_dir is None:
-        checkpoint_dir = str(Path.home() / ".assistant-skills" / "checkpoints")
+        checkpoint_dir = Path.home() / ".assistant-skills" / "checkpoints"
 
     checkpoint_path = Path(checkpoint_dir)
     if not checkpoint_path.exists():
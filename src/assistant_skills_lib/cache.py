@@ -6,6 +6,7 @@ pattern-based invalidation, and thread-safe access.
 
 Features:
 - SQLite-based persistence for durability
+- Compact JSON storage, zlib-compressed for large entries
 - Category-based TTL defaults
 - LRU eviction when cache size limit is reached
 - Pattern-based key invalidation (glob patterns with SQL LIKE optimization)
@@ -18,14 +19,20 @@ import functools
 import hashlib
 import json
 import os
+import re
 import sqlite3
 import threading
 import time
+import zlib
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+# Serialized values at least this large are stored zlib-compressed
+COMPRESS_THRESHOLD_BYTES = 1024
 
 
 @dataclass
@@ -63,18 +70,50 @@ def glob_to_sql_like(pattern: str) -> tuple[str, bool]:
     if not is_simple_glob_pattern(pattern):
         return pattern, False
 
-    sql_pattern = pattern.replace('%', r'\%').replace('_', r'\_')
+    sql_pattern = pattern.replace('\\', '\\\\').replace('%', r'\%').replace('_', r'\_')
     sql_pattern = sql_pattern.replace('**/', '%').replace('**', '%').replace('*', '%').replace('?', '_')
 
     return sql_pattern, True
 
 
+def glob_prefix_range(pattern: str) -> Optional[tuple[str, Optional[str]]]:
+    """
+    Convert a pure prefix glob (e.g. 'proj-1-*') to a key range.
+
+    Returns (lower, upper) bounds such that lower <= key < upper matches
+    exactly the keys the pattern matches, or None if the pattern should fall
+    back to LIKE. upper is None when the range is unbounded. Unlike LIKE,
+    range queries use the primary key index.
+
+    Only prefixes without cased characters qualify: LIKE matches ASCII letters
+    case-insensitively and a key range cannot, so those keep using LIKE. None
+    is also returned when the upper bound would not be a valid code point.
+    """
+    if not pattern.endswith("*"):
+        return None
+    prefix = pattern[:-1]
+    if any(c in prefix for c in "*?[") or prefix.lower() != prefix.upper():
+        return None
+    if not prefix:
+        return "", None
+    upper = ord(prefix[-1]) + 1
+    if 0xD800 <= upper <= 0xDFFF or upper > 0x10FFFF:
+        return None
+    return prefix, prefix[:-1] + chr(upper)
+
+
 class SkillCache:
     """
     A generic caching layer for Assistant Skills API responses.
     """
 
-    def __init__(self, cache_name: str = "default", cache_dir: Optional[str] = None, max_size_mb: float = 100):
+    def __init__(
+        self,
+        cache_name: str = "default",
+        cache_dir: Optional[str] = None,
+        max_size_mb: float = 100,
+        clock: Callable[[], float] = time.time,
+    ):
         """
         Initialize cache.
 
@@ -86,6 +125,8 @@ class SkillCache:
             cache_name: A name for the cache database file (e.g., 'jira', 'confluence').
             cache_dir: Directory for cache storage (default: ~/.assistant-skills/cache).
             max_size_mb: Maximum cache size in megabytes (default: 100 MB).
+            clock: Function returning the current time in seconds since the epoch,
+                used for expiry and LRU timestamps (default: time.time).
         """
         self.base_cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".assistant-skills" / "cache"
         self.base_cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
@@ -93,23 +134,27 @@ class SkillCache:
 
         self.max_size = int(max_size_mb * 1024 * 1024)
         self.db_path = self.base_cache_dir / f"{cache_name}.db"
+        self._db_path_str = os.fspath(self.db_path)
 
-        self.ttl_defaults = {
+        self.ttl_defaults: dict[str, Union[timedelta, float]] = {
             "default": timedelta(minutes=5),
         }
 
+        self._clock = clock
         self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
         self._hits = 0
         self._misses = 0
 
         self._init_db()
 
-    def set_ttl_defaults(self, defaults: dict[str, timedelta]):
+    def set_ttl_defaults(self, defaults: dict[str, Union[timedelta, float]]):
         """
         Set or override TTL defaults for different categories.
 
         Args:
-            defaults: A dictionary mapping category names to timedelta objects.
+            defaults: A dictionary mapping category names to timedelta objects
+                or TTLs in seconds.
         """
         self.ttl_defaults.update(defaults)
 
@@ -134,21 +179,40 @@ class SkillCache:
             conn.commit()
 
     @contextmanager
-    def _get_connection(self):
-        """Get thread-safe database connection."""
-        conn = sqlite3.connect(str(self.db_path), timeout=30)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get the database connection for this cache.
+
+        The connection is opened on first use and reused for subsequent
+        operations, avoiding a connect/close round trip per call. Access is
+        serialized through the instance lock.
+
+        The database runs in WAL mode with synchronous=NORMAL, so commits
+        append to the write-ahead log without an fsync per transaction.
+
+        If the block raises, its uncommitted statements are rolled back so a
+        later commit() on the shared connection cannot persist them.
+        """
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self._db_path_str, timeout=30, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn = conn
+            conn = self._conn
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
 
     def get(self, key: str, category: str = "default") -> Optional[Any]:
         """
         Get cached value if not expired.
         """
         with self._lock:
-            now = time.time()
+            now = self._clock()
             with self._get_connection() as conn:
                 cursor = conn.execute("SELECT value, expires_at FROM cache_entries WHERE key = ? AND category = ?", (key, category))
                 row = cursor.fetchone()
@@ -166,64 +230,72 @@ class SkillCache:
                 conn.execute("UPDATE cache_entries SET last_accessed_at = ? WHERE key = ? AND category = ?", (now, key, category))
                 conn.commit()
                 self._hits += 1
-                return json.loads(row["value"])
+                value = row["value"]
+                if isinstance(value, bytes):
+                    value = zlib.decompress(value)
+                return json.loads(value)
 
-    def set(self, key: str, value: Any, category: str = "default", ttl: Optional[timedelta] = None) -> None:
+    def set(self, key: str, value: Any, category: str = "default", ttl: Optional[Union[timedelta, float]] = None) -> None:
         """
-        Set cache value with optional custom TTL.
+        Set cache value with optional custom TTL (timedelta or seconds).
         """
         with self._lock:
             if ttl is None:
                 ttl = self.ttl_defaults.get(category, self.ttl_defaults["default"])
 
-            now = time.time()
-            expires_at = now + ttl.total_seconds()
-            value_json = json.dumps(value)
-            size_bytes = len(value_json.encode('utf-8'))
+            now = self._clock()
+            expires_at = now + (ttl.total_seconds() if isinstance(ttl, timedelta) else ttl)
+            value_json = json.dumps(value, separators=(",", ":"))
+            encoded = value_json.encode('utf-8')
+            stored_value: Union[str, bytes] = value_json
+            if len(encoded) >= COMPRESS_THRESHOLD_BYTES:
+                # Stored as a BLOB; get() tells the two forms apart by type.
+                stored_value = encoded = zlib.compress(encoded)
+            size_bytes = len(encoded)
 
             if size_bytes > self.max_size:
                 raise ValueError(f"Cache entry size ({size_bytes} bytes) exceeds maximum cache size ({self.max_size} bytes).")
 
-            self._evict_if_needed(size_bytes)
-
             with self._get_connection() as conn:
+                self._evict_if_needed(conn, size_bytes)
                 conn.execute("INSERT OR REPLACE INTO cache_entries (key, category, value, size_bytes, created_at, expires_at, last_accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                             (key, category, value_json, size_bytes, now, expires_at, now))
+                             (key, category, stored_value, size_bytes, now, expires_at, now))
                 conn.commit()
 
-    def _evict_if_needed(self, new_entry_size: int) -> None:
-        """Evict entries if adding new entry would exceed size limit."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) as total FROM cache_entries")
-            current_size = cursor.fetchone()["total"]
-
-            if current_size + new_entry_size <= self.max_size:
-                return
-
-            space_needed = current_size + new_entry_size - self.max_size
-            conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (time.time(),))
-            conn.commit()
-
-            cursor = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) as total FROM cache_entries")
-            current_size = cursor.fetchone()["total"]
-
-            if current_size + new_entry_size <= self.max_size:
-                return
-
-            space_needed = current_size + new_entry_size - self.max_size
-            freed = 0
-            cursor = conn.execute("SELECT key, category, size_bytes FROM cache_entries ORDER BY last_accessed_at ASC")
-
-            entries_to_delete = []
-            for row in cursor:
-                if freed >= space_needed:
-                    break
-                entries_to_delete.append((row["key"], row["category"]))
-                freed += row["size_bytes"]
+    def _evict_if_needed(self, conn: sqlite3.Connection, new_entry_size: int) -> None:
+        """
+        Evict entries if adding new entry would exceed size limit.
 
-            if entries_to_delete:
-                conn.executemany("DELETE FROM cache_entries WHERE key = ? AND category = ?", entries_to_delete)
-            conn.commit()
+        Runs inside the caller's transaction; the caller is responsible for committing.
+        """
+        cursor = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) as total FROM cache_entries")
+        current_size = cursor.fetchone()["total"]
+
+        if current_size + new_entry_size <= self.max_size:
+            return
+
+        conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (self._clock(),))
+
+        cursor = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) as total FROM cache_entries")
+        current_size = cursor.fetchone()["total"]
+
+        if current_size + new_entry_size <= self.max_size:
+            return
+
+        space_needed = current_size + new_entry_size - self.max_size
+        # Delete least recently used entries until enough space is freed: an
+        # entry goes if the space freed by all older entries is still short.
+        conn.execute("""
+            DELETE FROM cache_entries WHERE rowid IN (
+                SELECT rowid FROM (
+                    SELECT rowid, SUM(size_bytes) OVER (
+                        ORDER BY last_accessed_at, rowid ROWS UNBOUNDED PRECEDING
+                    ) - size_bytes AS freed_before
+                    FROM cache_entries
+                )
+                WHERE freed_before < ?
+            )
+        """, (space_needed,))
 
     def invalidate(self, key: Optional[str] = None, pattern: Optional[str] = None, category: Optional[str] = None) -> int:
         """
@@ -233,8 +305,20 @@ class SkillCache:
             if key is not None and category is not None:
                 cursor = conn.execute("DELETE FROM cache_entries WHERE key = ? AND category = ?", (key, category))
             elif pattern is not None:
+                key_range = glob_prefix_range(pattern)
                 sql_pattern, can_use_like = glob_to_sql_like(pattern)
-                if can_use_like:
+                if key_range is not None:
+                    lower, upper = key_range
+                    query = "DELETE FROM cache_entries WHERE key >= ?"
+                    params = [lower]
+                    if upper is not None:
+                        query += " AND key < ?"
+                        params.append(upper)
+                    if category is not None:
+                        query += " AND category = ?"
+                        params.append(category)
+                    cursor = conn.execute(query, params)
+                elif can_use_like:
                     query = "DELETE FROM cache_entries WHERE key LIKE ? ESCAPE '\\'"
                     params = [sql_pattern]
                     if category is not None:
@@ -242,15 +326,18 @@ class SkillCache:
                         params.append(category)
                     cursor = conn.execute(query, params)
                 else:
-                    query = "SELECT key, category FROM cache_entries"
+                    # Translate and compile once instead of per row; normcase matches
+                    # fnmatch.fnmatch() semantics.
+                    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+                    query = "SELECT rowid, key FROM cache_entries"
                     params = []
                     if category is not None:
                         query += " WHERE category = ?"
                         params.append(category)
                     cursor = conn.execute(query, params)
-                    to_delete = [(row["key"], row["category"]) for row in cursor if fnmatch.fnmatch(row["key"], pattern)]
+                    to_delete = [(row["rowid"],) for row in cursor if match(os.path.normcase(row["key"]))]
                     if to_delete:
-                        conn.executemany("DELETE FROM cache_entries WHERE key = ? AND category = ?", to_delete)
+                        conn.executemany("DELETE FROM cache_entries WHERE rowid = ?", to_delete)
                         conn.commit()
                     return len(to_delete)
             elif category is not None:
@@ -265,7 +352,7 @@ class SkillCache:
         """Clear entire cache."""
         with self._lock, self._get_connection() as conn:
             cursor = conn.execute("SELECT COUNT(*) as count FROM cache_entries")
-            count = cursor.fetchone()["count"]
+            count: int = cursor.fetchone()["count"]
             conn.execute("DELETE FROM cache_entries")
             conn.commit()
             return count
@@ -274,14 +361,11 @@ class SkillCache:
         """Get cache statistics."""
         with self._lock, self._get_connection() as conn:
             stats = CacheStats(hits=self._hits, misses=self._misses)
-            cursor = conn.execute("SELECT COUNT(*) as count, COALESCE(SUM(size_bytes), 0) as total_size FROM cache_entries")
-            row = cursor.fetchone()
-            stats.entry_count = row["count"]
-            stats.total_size_bytes = row["total_size"]
-
             cursor = conn.execute("SELECT category, COUNT(*) as count, SUM(size_bytes) as size FROM cache_entries GROUP BY category")
             for row in cursor:
                 stats.by_category[row["category"]] = {"count": row["count"], "size_bytes": row["size"]}
+                stats.entry_count += row["count"]
+                stats.total_size_bytes += row["size"]
             return stats
 
     def generate_key(self, category: str, *args: Any, **kwargs: Any) -> str:
@@ -292,13 +376,19 @@ class SkillCache:
         key_str = ":".join(components)
 
         if len(key_str) > 200:
-            hash_suffix = hashlib.md5(key_str.encode()).hexdigest()[:16]
+            hash_suffix = hashlib.blake2b(key_str.encode(), digest_size=8).hexdigest()
             return f"{category}:{hash_suffix}"
         return key_str
 
     def close(self) -> None:
-        """Close cache (flush any pending operations)."""
-        pass
+        """Close the underlying database connection.
+
+        The cache remains usable; the connection is reopened on next access.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def __enter__(self):
         return self
@@ -329,22 +419,25 @@ def _get_default_cache() -> SkillCache:
     """Get or create the default cache instance.
 
     Thread-safe singleton access using double-checked locking pattern.
+    The fast path is a single dict lookup with no lock.
     """
-    if "default" not in _cache_registry:
+    cache = _cache_registry.get("default")
+    if cache is None:
         with _cache_registry_lock:
             # Double-check after acquiring lock
-            if "default" not in _cache_registry:
-                _cache_registry["default"] = SkillCache(cache_name="default")
-    return _cache_registry["default"]
+            cache = _cache_registry.get("default")
+            if cache is None:
+                cache = _cache_registry.setdefault("default", SkillCache(cache_name="default"))
+    return cache
 
 
-def cached(category: str = "default", ttl: Optional[timedelta] = None):
+def cached(category: str = "default", ttl: Optional[Union[timedelta, float]] = None):
     """
     Decorator to cache function results.
 
     Args:
         category: Cache category for TTL defaults.
-        ttl: Optional custom TTL for cached values.
+        ttl: Optional custom TTL for cached values (timedelta or seconds).
 
     Usage:
         @cached(category="api_calls", ttl=timedelta(minutes=10))
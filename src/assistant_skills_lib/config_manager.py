@@ -8,9 +8,12 @@ Handles loading and merging configuration from multiple sources:
 4. Hardcoded defaults (fallbacks)
 """
 
+import copy
+import functools
 import json
 import os
 import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Optional, TypeVar
@@ -18,6 +21,168 @@ from typing import Any, Optional, TypeVar
 # Generic type for subclasses of BaseConfigManager
 T = TypeVar('T', bound='BaseConfigManager')
 
+# Parsed settings files keyed by path, validated by _stat_signature(); oldest
+# entries are dropped past _JSON_CACHE_MAX_ENTRIES
+_json_cache: dict[Path, tuple[tuple[int, int, int, int], Any]] = {}
+_JSON_CACHE_MAX_ENTRIES = 32
+
+# Files modified this recently are not cached: a same-size rewrite within one
+# timestamp tick would be invisible to the signature (2 s covers FAT/exFAT)
+_RACY_WINDOW_NS = 2_000_000_000
+
+# .claude directories found by _lookup_claude_dir, keyed by (start, stop).
+# Only hits are stored so a .claude created later is still found.
+_claude_dir_cache: dict[tuple[Path, Optional[Path]], Path] = {}
+
+# Raw-fd open flags for settings files (fds from os.open are already
+# non-inheritable, so O_CLOEXEC is implied)
+_O_READ = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_O_WRITE = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _read_bytes(path: Path, size: int) -> bytes:
+    """
+    Read a whole file through a raw fd, sized from an earlier stat().
+
+    Skips the buffered-reader setup and its extra fstat/lseek calls.
+    """
+    fd = os.open(path, _O_READ)
+    try:
+        data = os.read(fd, size + 1)
+        if len(data) > size:
+            # The file grew after it was stat'ed; read the remainder
+            chunks = [data]
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+            data = b''.join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def _write_bytes(path: Path, payload: bytes, mode: int = 0o666) -> None:
+    """Truncate and write a file through a raw fd; `mode` applies on creation."""
+    fd = os.open(path, _O_WRITE, mode)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _load_json_file(path: Path, size: Optional[int] = None) -> Any:
+    """
+    Parse a JSON file.
+
+    Always uses the stdlib parser so files with NaN/Infinity are accepted
+    exactly as json.load() would.
+
+    Args:
+        path: File to parse
+        size: File size from a prior stat(), if known
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    data = path.read_bytes() if size is None else _read_bytes(path, size)
+    return json.loads(data)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as 2-space indented JSON, byte-for-byte as json.dump() writes it."""
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _stat_signature(st: os.stat_result) -> tuple[int, int, int, int]:
+    """Return the stat fields that change when a file is rewritten or replaced."""
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _read_json_cached(path: Path) -> Any:
+    """
+    Parse a JSON file, reusing the last result while its stat signature matches.
+
+    Files modified within the last _RACY_WINDOW_NS are parsed on every call,
+    since a rewrite within the same timestamp tick could leave the signature
+    unchanged. The returned object is shared between callers and must not be
+    mutated; deep-copy it before making changes.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    st = os.stat(path)
+    signature = _stat_signature(st)
+    entry = _json_cache.get(path)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    data = _load_json_file(path, st.st_size)
+    _json_cache.pop(path, None)
+    if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+        if len(_json_cache) >= _JSON_CACHE_MAX_ENTRIES:
+            del _json_cache[next(iter(_json_cache))]
+        _json_cache[path] = (signature, data)
+    return data
+
+
+def _forget_json(path: Path) -> None:
+    """Drop the cached parse of a file this process has just rewritten."""
+    _json_cache.pop(path, None)
+
+
+def _resolve_claude_dir(start: Path, stop: Optional[Path]) -> Optional[Path]:
+    """
+    Walk up from start looking for a .claude directory.
+
+    The walk stops before reaching `stop` (or at the filesystem root when
+    `stop` is None).
+    """
+    # Walk plain strings: one stat() per level without building Path objects
+    stop_str = os.fspath(stop) if stop is not None else None
+    current = os.fspath(start)
+    parent = os.path.dirname(current)
+    while current != parent and current != stop_str:
+        if os.path.isdir(os.path.join(current, '.claude')):
+            return Path(current, '.claude')
+        current, parent = parent, os.path.dirname(parent)
+    return None
+
+
+def _lookup_claude_dir(start: Path, stop: Optional[Path] = None) -> Optional[Path]:
+    """
+    Return the .claude directory for start, reusing an earlier hit.
+
+    Hits are shared across all manager instances and revalidated on use: a
+    hit whose directory has since been removed is dropped, and the levels
+    between start and the hit are checked again so a nearer .claude created
+    later takes over. Only the walk above the hit is saved. Misses are not
+    remembered, so the tree is walked again until a .claude appears.
+    """
+    key = (start, stop)
+    cached = _claude_dir_cache.get(key)
+    if cached is not None and cached.is_dir():
+        if cached.parent == start:
+            return cached
+        nearer = _resolve_claude_dir(start, cached.parent)
+        if nearer is None:
+            return cached
+        _claude_dir_cache[key] = nearer
+        return nearer
+    result = _resolve_claude_dir(start, stop)
+    if result is not None:
+        _claude_dir_cache[key] = result
+    else:
+        _claude_dir_cache.pop(key, None)
+    return result
+
+
+@functools.lru_cache(maxsize=256)
+def _env_var_names(env_prefix: str, cred_name: str) -> tuple[str, str]:
+    """Return the (service-specific, generic) env var names for a credential."""
+    generic_var = cred_name.upper()
+    return f"{env_prefix}_{generic_var}", generic_var
+
 
 class BaseConfigManager(ABC):
     """
@@ -51,16 +216,11 @@ class BaseConfigManager(ABC):
     def _find_claude_dir(self) -> Optional[Path]:
         """
         Find .claude directory by walking up from current directory.
+
+        Searches up to the user's home directory, but not beyond. Results are
+        shared with other managers through _lookup_claude_dir().
         """
-        current = Path.cwd()
-        # Search up to the user's home directory, but not beyond.
-        home = Path.home()
-        while current != current.parent and current != home.parent:
-            claude_dir = current / '.claude'
-            if claude_dir.is_dir():
-                return claude_dir
-            current = current.parent
-        return None
+        return _lookup_claude_dir(Path.cwd(), Path.home().parent)
 
     def _load_config(self) -> dict[str, Any]:
         """
@@ -73,41 +233,39 @@ class BaseConfigManager(ABC):
         claude_dir = self._find_claude_dir()
 
         if claude_dir:
-            # Load global settings.json first
-            global_settings_path = claude_dir / 'settings.json'
-            if global_settings_path.exists():
+            # Load global settings.json first, then local settings.local.json
+            # (overrides global settings)
+            for settings_path in (claude_dir / 'settings.json', claude_dir / 'settings.local.json'):
                 try:
-                    with open(global_settings_path) as f:
-                        global_config = json.load(f).get(self.service_name, {})
-                    config = self._merge_config(config, global_config)
-                except json.JSONDecodeError:
-                    # Ignore malformed config files, or log a warning
-                    pass
-
-            # Load local settings.local.json (overrides global settings)
-            local_settings_path = claude_dir / 'settings.local.json'
-            if local_settings_path.exists():
-                try:
-                    with open(local_settings_path) as f:
-                        local_config = json.load(f).get(self.service_name, {})
-                    config = self._merge_config(config, local_config)
-                except json.JSONDecodeError:
-                    # Ignore malformed config files, or log a warning
-                    pass
+                    service_config = _read_json_cached(settings_path).get(self.service_name)
+                except (FileNotFoundError, json.JSONDecodeError):
+                    # Ignore missing or malformed config files
+                    continue
+                if service_config:
+                    # Copy so later edits to self.config never reach the parse cache
+                    config = self._merge_config(config, copy.deepcopy(service_config))
 
         # Return the merged config under the service name key
         return {self.service_name: config}
 
     def _merge_config(self, base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
         """
-        Recursively merge override config into base config.
+        Deep-merge override config into base config.
+
+        Walks nested dicts with an explicit stack instead of recursion. Only
+        dicts on merged paths are copied, so neither argument is modified.
         """
         result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_config(result[key], value)
-            else:
-                result[key] = value
+        stack = [(result, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current = target[key] = current.copy()
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return result
 
     # Backwards compatibility alias
@@ -133,8 +291,7 @@ class BaseConfigManager(ABC):
         Get a credential from environment variables, checking service-specific and generic names.
         e.g., for cred_name='API_TOKEN' and service='JIRA', checks JIRA_API_TOKEN then API_TOKEN.
         """
-        service_specific_var = f"{self.env_prefix}_{cred_name.upper()}"
-        generic_var = cred_name.upper()
+        service_specific_var, generic_var = _env_var_names(self.env_prefix, cred_name)
 
         # Check service-specific var first, then generic
         return os.getenv(service_specific_var) or os.getenv(generic_var)
@@ -158,12 +315,15 @@ class BaseConfigManager(ABC):
         Returns:
             The singleton instance for this subclass
         """
-        if cls not in cls._instances:
+        # Fast path: a single dict lookup once the instance exists
+        instance = cls._instances.get(cls)
+        if instance is None:
             with cls._instance_lock:
                 # Double-check after acquiring lock
-                if cls not in cls._instances:
-                    cls._instances[cls] = cls()
-        return cls._instances[cls]  # type: ignore[return-value]
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = cls._instances[cls] = cls()
+        return instance  # type: ignore[return-value]
 
     @classmethod
     def reset_instance(cls: type[T]) -> None:
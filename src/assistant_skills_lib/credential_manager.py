@@ -14,6 +14,8 @@ Security considerations:
 
 from __future__ import annotations
 
+import copy
+import functools
 import gc
 import json
 import os
@@ -23,6 +25,13 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .config_manager import (
+    _dump_json,
+    _forget_json,
+    _lookup_claude_dir,
+    _read_json_cached,
+    _write_bytes,
+)
 from .error_handler import BaseAPIError, ValidationError, sanitize_error_message
 
 # Try to import keyring, gracefully handle if not installed
@@ -34,6 +43,17 @@ except ImportError:
     KEYRING_AVAILABLE = False
 
 
+@functools.lru_cache(maxsize=1)
+def _keychain_probe() -> bool:
+    """Return True if the keyring backend loads (checked once per process)."""
+    try:
+        # Test keyring functionality with a dummy operation
+        keyring.get_keyring()
+        return True
+    except Exception:
+        return False
+
+
 class CredentialBackend(Enum):
     """Available credential storage backends."""
 
@@ -77,6 +97,43 @@ class BaseCredentialManager(ABC):
     def __init__(self):
         """Initialize credential manager."""
         self._claude_dir = self._find_claude_dir()
+        self._local_settings = (
+            self._claude_dir / "settings.local.json" if self._claude_dir else None
+        )
+
+    # Subclass metadata is fixed, so each value is resolved once, on first use.
+    # Resolving lazily lets subclasses set attributes after super().__init__()
+    # that their hooks rely on.
+
+    @functools.cached_property
+    def _fields(self) -> tuple[str, ...]:
+        """Credential field names from get_credential_fields()."""
+        return tuple(self.get_credential_fields())
+
+    @functools.cached_property
+    def _env_prefix(self) -> str:
+        """Environment variable prefix from get_env_prefix()."""
+        return self.get_env_prefix()
+
+    @functools.cached_property
+    def _env_keys(self) -> tuple[tuple[str, str], ...]:
+        """(field, env var) pairs."""
+        return tuple(
+            (field, f"{self._env_prefix}_{field.upper()}") for field in self._fields
+        )
+
+    @functools.cached_property
+    def _json_key(self) -> str:
+        """Section name in settings.local.json (e.g., "jira" from "jira-assistant")."""
+        return self.get_service_name().replace("-assistant", "")
+
+    @functools.cached_property
+    def _hint(self) -> str:
+        """Default not-found hint built from the field/env var pairs."""
+        return "Set environment variables:\n" + "".join(
+            f"  export {env_var}='your-{field.replace('_', '-')}'\n"
+            for field, env_var in self._env_keys
+        )
 
     @abstractmethod
     def get_service_name(self) -> str:
@@ -128,14 +185,7 @@ class BaseCredentialManager(ABC):
 
         Override this to provide service-specific setup instructions.
         """
-        prefix = self.get_env_prefix()
-        fields = self.get_credential_fields()
-
-        hint = "Set environment variables:\n"
-        for field in fields:
-            env_var = f"{prefix}_{field.upper()}"
-            hint += f"  export {env_var}='your-{field.replace('_', '-')}'\n"
-        return hint
+        return self._hint
 
     def _find_claude_dir(self) -> Path | None:
         """
@@ -144,33 +194,20 @@ class BaseCredentialManager(ABC):
         Returns:
             Path to .claude directory or None if not found
         """
-        current = Path.cwd()
-
-        while current != current.parent:
-            claude_dir = current / ".claude"
-            if claude_dir.is_dir():
-                return claude_dir
-            current = current.parent
-
-        return None
+        return _lookup_claude_dir(Path.cwd())
 
     @staticmethod
     def is_keychain_available() -> bool:
         """
         Check if keyring is installed and functional.
 
+        The backend probe runs once per process; call
+        _keychain_probe.cache_clear() to force a re-check.
+
         Returns:
             True if keyring is available and working, False otherwise
         """
-        if not KEYRING_AVAILABLE:
-            return False
-
-        try:
-            # Test keyring functionality with a dummy operation
-            keyring.get_keyring()
-            return True
-        except Exception:
-            return False
+        return KEYRING_AVAILABLE and _keychain_probe()
 
     def get_credentials_from_env(self) -> dict[str, str | None]:
         """
@@ -179,15 +216,8 @@ class BaseCredentialManager(ABC):
         Returns:
             Dictionary of credential field -> value (may be None)
         """
-        prefix = self.get_env_prefix()
-        fields = self.get_credential_fields()
-
-        result = {}
-        for field in fields:
-            env_var = f"{prefix}_{field.upper()}"
-            result[field] = os.getenv(env_var)
-
-        return result
+        environ = os.environ
+        return {field: environ.get(env_var) for field, env_var in self._env_keys}
 
     def get_credentials_from_keychain(self) -> dict[str, str | None]:
         """
@@ -196,7 +226,7 @@ class BaseCredentialManager(ABC):
         Returns:
             Dictionary of credential field -> value (all None if not found)
         """
-        fields = self.get_credential_fields()
+        fields = self._fields
         empty_result = {field: None for field in fields}
 
         if not self.is_keychain_available():
@@ -221,24 +251,18 @@ class BaseCredentialManager(ABC):
         Returns:
             Dictionary of credential field -> value (may be None)
         """
-        fields = self.get_credential_fields()
+        fields = self._fields
         empty_result = {field: None for field in fields}
 
-        if not self._claude_dir:
-            return empty_result
-
-        local_settings = self._claude_dir / "settings.local.json"
-
-        if not local_settings.exists():
+        local_settings = self._local_settings
+        if local_settings is None:
             return empty_result
 
         try:
-            with open(local_settings) as f:
-                config = json.load(f)
+            config = _read_json_cached(local_settings)
 
             # Get service-specific config section
-            service_name = self.get_service_name().replace("-assistant", "")
-            service_config = config.get(service_name, {})
+            service_config = config.get(self._json_key, {})
             credentials = service_config.get("credentials", {})
 
             return {field: credentials.get(field) for field in fields}
@@ -260,8 +284,7 @@ class BaseCredentialManager(ABC):
         Raises:
             CredentialNotFoundError: If any credential not found
         """
-        fields = self.get_credential_fields()
-        result: dict[str, str | None] = {field: None for field in fields}
+        result: dict[str, str | None] = dict.fromkeys(self._fields)
 
         # Priority 1: Environment variables (highest priority)
         env_creds = self.get_credentials_from_env()
@@ -313,17 +336,18 @@ class BaseCredentialManager(ABC):
             ValidationError: If credentials are invalid
             BaseAPIError: If storage fails
         """
-        fields = self.get_credential_fields()
-
-        # Validate all required fields are present
-        for field in fields:
-            value = credentials.get(field)
-            if not value or not str(value).strip():
-                raise ValidationError(
-                    f"{field} cannot be empty",
-                    operation="store_credentials",
-                    details={"field": field},
-                )
+        # Validate all required fields are present, reporting every empty one
+        missing = [
+            field
+            for field in self._fields
+            if not (value := credentials.get(field)) or not str(value).strip()
+        ]
+        if missing:
+            raise ValidationError(
+                f"{', '.join(missing)} cannot be empty",
+                operation="store_credentials",
+                details={"field": missing[0], "fields": missing},
+            )
 
         # Determine backend
         if backend is None:
@@ -365,40 +389,29 @@ class BaseCredentialManager(ABC):
 
     def _store_to_json(self, credentials: dict[str, str]) -> CredentialBackend:
         """Store credentials in settings.local.json."""
-        if not self._claude_dir:
+        local_settings = self._local_settings
+        if local_settings is None:
             raise BaseAPIError(
                 "Cannot find .claude directory. Run from project root."
             )
 
-        local_settings = self._claude_dir / "settings.local.json"
-
         try:
             # Load existing config or create new
-            if local_settings.exists():
-                with open(local_settings) as f:
-                    config = json.load(f)
-            else:
+            try:
+                config = copy.deepcopy(_read_json_cached(local_settings))
+            except FileNotFoundError:
                 config = {}
 
-            # Get service section name (e.g., "jira" from "jira-assistant")
-            service_name = self.get_service_name().replace("-assistant", "")
+            # Ensure structure exists and store credentials
+            service_config = config.setdefault(self._json_key, {})
+            service_config.setdefault("credentials", {}).update(credentials)
 
-            # Ensure structure exists
-            if service_name not in config:
-                config[service_name] = {}
-            if "credentials" not in config[service_name]:
-                config[service_name]["credentials"] = {}
+            # Write with secure permissions (new files are created 0600)
+            _write_bytes(local_settings, _dump_json(config), stat.S_IRUSR | stat.S_IWUSR)
 
-            # Store credentials
-            for field, value in credentials.items():
-                config[service_name]["credentials"][field] = value
-
-            # Write with secure permissions
-            with open(local_settings, "w") as f:
-                json.dump(config, f, indent=2)
-
-            # Set restrictive permissions (owner read/write only)
+            # Set restrictive permissions on pre-existing files too
             os.chmod(local_settings, stat.S_IRUSR | stat.S_IWUSR)
+            _forget_json(local_settings)
 
             return CredentialBackend.JSON_FILE
         except Exception as e:
@@ -424,21 +437,20 @@ class BaseCredentialManager(ABC):
                 pass  # May not exist
 
         # Delete from JSON
-        if self._claude_dir:
-            local_settings = self._claude_dir / "settings.local.json"
-            if local_settings.exists():
-                try:
-                    with open(local_settings) as f:
-                        config = json.load(f)
-
-                    service_name = self.get_service_name().replace("-assistant", "")
-                    if service_name in config and "credentials" in config[service_name]:
-                        del config[service_name]["credentials"]
-                        deleted = True
-
-                        with open(local_settings, "w") as f:
-                            json.dump(config, f, indent=2)
-                except Exception:
-                    pass
+        local_settings = self._local_settings
+        if local_settings is not None:
+            try:
+                config = _read_json_cached(local_settings)
+
+                service_name = self._json_key
+                if service_name in config and "credentials" in config[service_name]:
+                    config = copy.deepcopy(config)
+                    del config[service_name]["credentials"]
+                    deleted = True
+
+                    _write_bytes(local_settings, _dump_json(config))
+                    _forget_json(local_settings)
+            except Exception:
+                pass  # Missing or unreadable file
 
         return deleted
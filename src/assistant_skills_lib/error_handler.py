@@ -109,22 +109,11 @@ class AuthorizationError(PermissionError):
     pass
 
 
-def sanitize_error_message(message: str) -> str:
-    """
-    Remove common sensitive information from error messages.
-    Service-specific sanitization should extend this.
-
-    Args:
-        message: The error message to sanitize
-
-    Returns:
-        Sanitized message with sensitive data removed
-    """
-    if not isinstance(message, str):
-        return str(message) # Ensure message is a string
-
-    # Common patterns to sanitize
-    patterns = [
+# Common sensitive-data patterns, compiled once and applied in order. The order
+# matters: each pass sees the output of the previous one, so an earlier
+# pattern's redaction can't hide a later secret from its own pattern.
+_SANITIZE_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile(pattern), replacement) for pattern, replacement in (
         # Generic API tokens/keys (various formats)
         (r'(?i)(api[_-]?token|token|apikey|api[_-]?key)["\s:=]+[A-Za-z0-9_\-]{10,}', r'\1=[REDACTED]'),
         # Email addresses
@@ -139,11 +128,27 @@ def sanitize_error_message(message: str) -> str:
         (r'(?i)(session[_-]?id|jsessionid)["\s:=]+[A-Za-z0-9_\-]+', r'\1=[REDACTED]'),
         # Generic secrets/passwords
         (r'(?i)(secret|password|passwd|pwd)["\s:=]+[^\s"\\]+', r'\1=[REDACTED]'),
-    ]
+    )
+)
+
+
+def sanitize_error_message(message: str) -> str:
+    """
+    Remove common sensitive information from error messages.
+    Service-specific sanitization should extend this.
+
+    Args:
+        message: The error message to sanitize
+
+    Returns:
+        Sanitized message with sensitive data removed
+    """
+    if not isinstance(message, str):
+        return str(message) # Ensure message is a string
 
     sanitized = message
-    for pattern, replacement in patterns:
-        sanitized = re.sub(pattern, replacement, sanitized)
+    for pattern, replacement in _SANITIZE_PATTERNS:
+        sanitized = pattern.sub(replacement, sanitized)
 
     return sanitized
 
@@ -288,6 +293,8 @@ class ErrorContext:
             client.post("/api/resources", data=resource_data)
     """
 
+    __slots__ = ('operation', 'context')
+
     def __init__(self, operation: str, **context: Any):
         self.operation = operation
         self.context = context
@@ -297,9 +304,13 @@ class ErrorContext:
 
     def __exit__(self, exc_type: Optional[type[BaseAPIError]], exc_val: Optional[BaseAPIError], exc_tb: Any) -> bool:
         if exc_type is not None and issubclass(exc_type, BaseAPIError):
-            # Enhance error message with context
-            context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
-            exc_val.operation = f"{self.operation} ({context_str})" if context_str else self.operation
+            # Enhance error message with context; formatting is deferred to
+            # here so the success path does no string work
+            if self.context:
+                context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
+                exc_val.operation = f"{self.operation} ({context_str})"
+            else:
+                exc_val.operation = self.operation
         return False  # Don't suppress the exception
 
 
@@ -51,6 +51,18 @@ SENSITIVE_FIELD_PATTERNS: frozenset[str] = frozenset({
     "bearer",
 })
 
+# All patterns as one case-insensitive alternation, so a field name is scanned
+# once. Patterns containing a shorter pattern (e.g. "access_token" contains
+# "token") can never change the result and are left out.
+_SENSITIVE_FIELD_RE = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern in sorted(SENSITIVE_FIELD_PATTERNS)
+        if not any(other != pattern and other in pattern for other in SENSITIVE_FIELD_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+
 
 def is_sensitive_field(field_name: str) -> bool:
     """
@@ -65,8 +77,7 @@ def is_sensitive_field(field_name: str) -> bool:
     Returns:
         True if the field appears to contain sensitive data
     """
-    field_lower = field_name.lower()
-    return any(pattern in field_lower for pattern in SENSITIVE_FIELD_PATTERNS)
+    return _SENSITIVE_FIELD_RE.search(field_name) is not None
 
 
 def redact_sensitive_value(field_name: str, value: Any) -> Any:
@@ -119,9 +130,24 @@ class Colors:
     RESET = '\033[0m'
 
 
+# (stream, supports_color) for the last sys.stdout that was checked
+_color_support: tuple[Any, bool] = (None, False)
+
+
 def _supports_color() -> bool:
-    """Check if terminal supports color."""
-    return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+    """
+    Check if terminal supports color.
+
+    The isatty() answer is remembered for the current ``sys.stdout`` object
+    and only re-checked when stdout is replaced (e.g. redirected or captured).
+    """
+    global _color_support
+    stream = sys.stdout
+    cached_stream, supported = _color_support
+    if stream is not cached_stream:
+        supported = hasattr(stream, 'isatty') and stream.isatty()
+        _color_support = (stream, supported)
+    return supported
 
 
 def _colorize(text: str, color: str) -> str:
@@ -131,6 +157,21 @@ def _colorize(text: str, color: str) -> str:
     return text
 
 
+def _table_cell(value: Any) -> str:
+    """Render a single table value as a string for tabulate."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return ', '.join(map(str, value))
+    if isinstance(value, dict):
+        # Try to get a 'name' or 'title' from dict, otherwise stringify
+        if 'name' in value:
+            return str(value['name'])
+        if 'title' in value:
+            return str(value['title'])
+    return str(value)
+
+
 def format_table(
     data: Sequence[dict[str, Any]],
     columns: Optional[list[str]] = None,
@@ -165,18 +206,8 @@ def format_table(
     # Use tabulate if available
     if HAS_TABULATE:
         # Prepare rows, ensuring all items are strings for tabulate
-        rows = []
-        for row_dict in data:
-            row_list = []
-            for col_key in columns:
-                value = row_dict.get(col_key, '')
-                if isinstance(value, (list, tuple)):
-                    value = ', '.join(map(str, value))
-                elif isinstance(value, dict):
-                    # Try to get a 'name' or 'title' from dict, otherwise stringify
-                    value = value.get('name', value.get('title', str(value)))
-                row_list.append(str(value))
-            rows.append(row_list)
+        cell = _table_cell
+        rows = [[cell(row_dict.get(col_key, '')) for col_key in columns] for row_dict in data]
         return tabulate(rows, headers=headers, tablefmt=tablefmt)
     else:
         # Fallback to basic table formatting logic
@@ -195,14 +226,16 @@ def _format_basic_table_fallback(
     """
     lines = []
 
-    # Calculate column widths
+    # Stringify every cell once; the width pass and the render pass share them
+    str_rows = [[str(row.get(key, '')) for key in columns] for row in data]
+
+    # Calculate column widths in one pass. Anything longer than max_col_width
+    # is capped below, so truncated values need no special handling here.
     widths = [len(str(h)) for h in headers]
-    for row in data:
-        for i, key in enumerate(columns):
-            val = str(row.get(key, ''))
-            if truncate_long_values and len(val) > max_col_width:
-                val = val[:max_col_width - 3] + "..."
-            widths[i] = max(widths[i], len(val))
+    for cells in str_rows:
+        for i, val in enumerate(cells):
+            if len(val) > widths[i]:
+                widths[i] = len(val)
 
     # Apply max_col_width to calculated widths
     widths = [min(w, max_col_width) for w in widths]
@@ -216,11 +249,11 @@ def _format_basic_table_fallback(
     lines.append(separator)
 
     # Data rows
-    for row_dict in data:
-        row_str = ' | '.join(
-            (str(row_dict.get(key, ''))[:widths[i]] if truncate_long_values else str(row_dict.get(key, ''))).ljust(widths[i])
-            for i, key in enumerate(columns)
-        )
+    for cells in str_rows:
+        if truncate_long_values:
+            row_str = ' | '.join(val[:widths[i]].ljust(widths[i]) for i, val in enumerate(cells))
+        else:
+            row_str = ' | '.join(val.ljust(widths[i]) for i, val in enumerate(cells))
         lines.append(row_str)
 
     return '\n'.join(lines)
@@ -246,27 +279,37 @@ def format_tree(
     """
     lines = [root]
 
-    def add_items(current_items: list, prefix: str = '', is_last_parent: bool = True):
-        for i, item in enumerate(current_items):
-            is_last = i == len(current_items) - 1
-
-            # Determine branch character
-            if is_last:
-                branch = '└── '
-                next_prefix = prefix + '    '
-            else:
-                branch = '├── '
-                next_prefix = prefix + '│   '
-
-            # Get name
-            name = item.get(name_key, str(item)) if isinstance(item, dict) else str(item)
-            lines.append(f"{prefix}{branch}{name}")
+    # Depth-first walk with an explicit stack of (remaining items, index of
+    # the last item, prefix) so deeply nested trees don't hit the recursion limit.
+    stack = [(enumerate(items), len(items) - 1, '')]
+    while stack:
+        entries, last_index, prefix = stack[-1]
+        entry = next(entries, None)
+        if entry is None:
+            stack.pop()
+            continue
+        i, item = entry
+
+        # Determine branch character
+        if i == last_index:
+            branch = '└── '
+            next_prefix = prefix + '    '
+        else:
+            branch = '├── '
+            next_prefix = prefix + '│   '
+
+        # Get name (only stringify the whole item when it has no name)
+        if isinstance(item, dict) and name_key in item:
+            name = item[name_key]
+        else:
+            name = str(item)
+        lines.append(f"{prefix}{branch}{name}")
+
+        # Process children before the remaining siblings
+        if isinstance(item, dict) and children_key in item:
+            children = item[children_key]
+            stack.append((enumerate(children), len(children) - 1, next_prefix))
 
-            # Process children
-            if isinstance(item, dict) and children_key in item:
-                add_items(item[children_key], next_prefix, is_last)
-
-    add_items(items)
     return '\n'.join(lines)
 
 
@@ -315,10 +358,10 @@ def format_list(
         display_items = items[:max_items]
         truncated = True
 
-    lines = []
-    for i, item in enumerate(display_items, 1):
-        prefix = f"{i}." if numbered else bullet
-        lines.append(f" {prefix} {item}")
+    if numbered:
+        lines = [f" {i}. {item}" for i, item in enumerate(display_items, 1)]
+    else:
+        lines = [f" {bullet} {item}" for item in display_items]
 
     if truncated:
         remaining = len(items) - max_items
@@ -13,10 +13,59 @@ Usage:
 """
 
 import json
+import os
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any, Optional
 
 
+def _skill_entries(skills_dir: Path) -> list[os.DirEntry[str]]:
+    """Return the skill directories under .claude/skills, excluding 'shared'."""
+    try:
+        with os.scandir(skills_dir) as it:
+            return [entry for entry in it if entry.name != 'shared' and entry.is_dir()]
+    except OSError:
+        return []
+
+
+def _script_names(scripts_dir: str) -> list[str]:
+    """Return the *.py file names directly in scripts_dir, excluding __init__.py."""
+    try:
+        with os.scandir(scripts_dir) as it:
+            return [
+                entry.name for entry in it
+                if entry.name.endswith('.py') and entry.name != '__init__.py'
+            ]
+    except OSError:
+        return []
+
+
+def _iter_files(root: str) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield every non-directory entry below root.
+
+    Uses os.scandir so file types come from the directory listing instead of
+    one stat() per entry. Symlinked directories are not followed.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry
+
+
+def _count_files(root: str, match: Callable[[str], bool]) -> int:
+    """Count files below root whose name satisfies match."""
+    return sum(1 for entry in _iter_files(root) if match(entry.name))
+
+
 def detect_project(path: str) -> Optional[dict[str, Any]]:
     """
     Detect if a path contains an Assistant Skills project.
@@ -50,16 +99,11 @@ def detect_project(path: str) -> Optional[dict[str, Any]]:
         'path': str(project_path),
         'name': project_path.name,
         'topic_prefix': None,
-        'skills': [],
+        'skills': [entry.name for entry in _skill_entries(skills_dir)],
         'has_shared_lib': (skills_dir / 'shared').exists(),
         'has_settings': (claude_dir / 'settings.json').exists()
     }
 
-    # Detect skills
-    for item in skills_dir.iterdir():
-        if item.is_dir() and item.name != 'shared':
-            project_info['skills'].append(item.name)
-
     # Detect topic prefix from skill names
     if project_info['skills']:
         # Find common prefix (e.g., "jira-" from "jira-issue", "jira-search")
@@ -105,30 +149,16 @@ def list_skills(project_path: str) -> list[dict[str, Any]]:
     path = Path(project_path).expanduser().resolve()
     skills_dir = path / '.claude' / 'skills'
 
-    if not skills_dir.exists():
-        return []
-
     skills = []
 
-    for item in sorted(skills_dir.iterdir()):
-        if item.is_dir() and item.name != 'shared':
-            skill_info = {
-                'name': item.name,
-                'path': str(item),
-                'has_skill_md': (item / 'SKILL.md').exists(),
-                'scripts': [],
-                'has_tests': (item / 'tests').exists()
-            }
-
-            # List scripts
-            scripts_dir = item / 'scripts'
-            if scripts_dir.exists():
-                skill_info['scripts'] = [
-                    f.name for f in scripts_dir.glob('*.py')
-                    if f.name != '__init__.py'
-                ]
-
-            skills.append(skill_info)
+    for entry in sorted(_skill_entries(skills_dir), key=lambda e: e.name):
+        skills.append({
+            'name': entry.name,
+            'path': entry.path,
+            'has_skill_md': os.path.exists(os.path.join(entry.path, 'SKILL.md')),
+            'scripts': _script_names(os.path.join(entry.path, 'scripts')),
+            'has_tests': os.path.exists(os.path.join(entry.path, 'tests'))
+        })
 
     return skills
 
@@ -160,13 +190,7 @@ def get_shared_lib_modules(project_path: str) -> list[str]:
     path = Path(project_path).expanduser().resolve()
     lib_dir = path / '.claude' / 'skills' / 'shared' / 'scripts' / 'lib'
 
-    if not lib_dir.exists():
-        return []
-
-    return [
-        f.stem for f in lib_dir.glob('*.py')
-        if f.name != '__init__.py'
-    ]
+    return [name[:-3] for name in _script_names(str(lib_dir))]
 
 
 def validate_structure(project_path: str) -> dict[str, Any]:
@@ -271,26 +295,23 @@ def get_project_stats(project_path: str) -> dict[str, int]:
         'docs': 0
     }
 
-    if not skills_dir.exists():
-        return stats
-
-    for skill_dir in skills_dir.iterdir():
-        if skill_dir.is_dir() and skill_dir.name != 'shared':
-            stats['skills'] += 1
-
-            # Count scripts
-            scripts_dir = skill_dir / 'scripts'
-            if scripts_dir.exists():
-                stats['scripts'] += len([f for f in scripts_dir.glob('*.py') if f.name != '__init__.py'])
-
-            # Count tests
-            tests_dir = skill_dir / 'tests'
-            if tests_dir.exists():
-                stats['tests'] += len(list(tests_dir.rglob('test_*.py')))
-
-            # Count docs
-            docs_dir = skill_dir / 'docs'
-            if docs_dir.exists():
-                stats['docs'] += len(list(docs_dir.rglob('*.md')))
+    for entry in _skill_entries(skills_dir):
+        stats['skills'] += 1
+        skill_path = entry.path
+
+        # Count scripts
+        stats['scripts'] += len(_script_names(os.path.join(skill_path, 'scripts')))
+
+        # Count tests
+        stats['tests'] += _count_files(
+            os.path.join(skill_path, 'tests'),
+            lambda name: name.startswith('test_') and name.endswith('.py'),
+        )
+
+        # Count docs
+        stats['docs'] += _count_files(
+            os.path.join(skill_path, 'docs'),
+            lambda name: name.endswith('.md'),
+        )
 
     return stats
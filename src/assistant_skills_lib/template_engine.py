@@ -12,6 +12,8 @@ Usage:
     rendered = render_template(template, {"API_NAME": "GitHub", "TOPIC": "github"})
 """
 
+import functools
+import os
 import re
 from pathlib import Path
 from typing import Any, Optional
@@ -19,6 +21,9 @@ from typing import Any, Optional
 # Regex pattern for {{PLACEHOLDER}} syntax
 PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
 
+# File suffixes picked up by list_template_files()
+_TEMPLATE_SUFFIXES = ('.md', '.template')
+
 
 def load_template(path: str) -> str:
     """
@@ -63,6 +68,18 @@ def list_placeholders(template: str) -> list[str]:
     return sorted(set(matches))
 
 
+@functools.lru_cache(maxsize=128)
+def _template_parts(template: str) -> tuple[str, ...]:
+    """
+    Split a template into alternating literal text and placeholder names.
+
+    Even indices hold literal text and odd indices hold placeholder names.
+    Templates are usually rendered many times, so the split is memoized and
+    repeat renders skip the regex scan entirely.
+    """
+    return tuple(PLACEHOLDER_PATTERN.split(template))
+
+
 def render_template(template: str, context: dict[str, str], strict: bool = True) -> str:
     """
     Replace placeholders in template with values from context.
@@ -82,19 +99,24 @@ def render_template(template: str, context: dict[str, str], strict: bool = True)
         >>> render_template("Hello {{NAME}}!", {"NAME": "World"})
         'Hello World!'
     """
-    if strict:
-        required = set(list_placeholders(template))
-        provided = set(context.keys())
-        missing = required - provided
+    parts = _template_parts(template)
+    pieces = list(parts)
 
-        if missing:
-            raise ValueError(f"Missing placeholder values: {', '.join(sorted(missing))}")
+    # Missing names are collected during substitution, so the template is
+    # walked once even in strict mode.
+    missing: set[str] = set()
+    for i in range(1, len(parts), 2):
+        key = parts[i]
+        if key in context:
+            pieces[i] = context[key]
+        else:
+            missing.add(key)
+            pieces[i] = f"{{{{{key}}}}}"
 
-    def replace(match):
-        key = match.group(1)
-        return context.get(key, match.group(0))
+    if strict and missing:
+        raise ValueError(f"Missing placeholder values: {', '.join(sorted(missing))}")
 
-    return PLACEHOLDER_PATTERN.sub(replace, template)
+    return ''.join(pieces)
 
 
 def validate_context(template: str, context: dict[str, str]) -> dict[str, Any]:
@@ -112,8 +134,8 @@ def validate_context(template: str, context: dict[str, str]) -> dict[str, Any]:
             - extra: list - Context keys not used in template
             - used: list - Placeholders that will be replaced
     """
-    required = set(list_placeholders(template))
-    provided = set(context.keys())
+    required = set(PLACEHOLDER_PATTERN.findall(template))
+    provided = set(context)
 
     return {
         'valid': required <= provided,
@@ -165,20 +187,23 @@ def list_template_files(category: Optional[str] = None) -> list[dict[str, str]]:
         categories = [c for c in categories if category in c]
 
     for cat in categories:
-        cat_path = template_dir / cat
-        if cat_path.exists():
-            for file in cat_path.rglob("*.md"):
-                templates.append({
-                    'name': file.name,
-                    'path': str(file),
-                    'category': cat
-                })
-            for file in cat_path.rglob("*.template"):
-                templates.append({
-                    'name': file.name,
-                    'path': str(file),
-                    'category': cat
-                })
+        # One scandir walk per category picks up both template suffixes
+        pending = [str(template_dir / cat)]
+        while pending:
+            try:
+                it = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(_TEMPLATE_SUFFIXES):
+                        templates.append({
+                            'name': entry.name,
+                            'path': entry.path,
+                            'category': cat
+                        })
 
     return sorted(templates, key=lambda x: (x['category'], x['name']))
 
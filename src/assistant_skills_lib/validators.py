@@ -9,6 +9,7 @@ Security validators:
 """
 
 import re
+import stat
 from pathlib import Path
 from typing import Any, Optional, Union
 from urllib.parse import quote
@@ -16,6 +17,24 @@ from urllib.parse import quote
 # Import ValidationError from the base error_handler
 from assistant_skills_lib.error_handler import ValidationError
 
+# validate_name patterns keyed by (allow_dashes, allow_underscores)
+_NAME_RES = {
+    (False, False): re.compile(r'^[a-zA-Z0-9]+$'),
+    (False, True): re.compile(r'^[a-zA-Z0-9_]+$'),
+    (True, False): re.compile(r'^[a-zA-Z0-9\-]+$'),
+    (True, True): re.compile(r'^[a-zA-Z0-9\-_]+$'),
+}
+_NAME_SUGGESTION_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_TOPIC_PREFIX_RE = re.compile(r'^[a-z][a-z0-9]*$')
+_TOPIC_SUGGESTION_RE = re.compile(r'[^a-z0-9]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# scheme and netloc of an ordinary URL, as urlparse would split them. The
+# netloc is limited to printable ASCII other than / ? # [ ] so non-ASCII hosts
+# still get urlparse's NFKC netloc check (CVE-2019-9636).
+_URL_PREFIX_RE = re.compile(
+    r'([A-Za-z][A-Za-z0-9+.-]*)://([\x21\x22\x24-\x2e\x30-\x3e\x40-\x5a\x5c\x5e-\x7e]*)(?=[/?#]|\Z)'
+)
+
 
 def validate_required(value: Optional[Any], field_name: str = "value") -> str:
     """
@@ -81,16 +100,7 @@ def validate_name(
             operation="validation", details={"field": field_name, "value": name}
         )
 
-    # Build allowed pattern
-    allowed = r'a-zA-Z0-9'
-    if allow_dashes:
-        allowed += r'\-'
-    if allow_underscores:
-        allowed += r'_'
-
-    pattern = f'^[{allowed}]+$'
-
-    if not re.match(pattern, name):
+    if not _NAME_RES[bool(allow_dashes), bool(allow_underscores)].match(name):
         allowed_desc = "letters, numbers"
         if allow_dashes:
             allowed_desc += ", dashes"
@@ -100,7 +110,7 @@ def validate_name(
         raise ValidationError(
             f"{field_name} can only contain {allowed_desc}",
             operation="validation",
-            details={"field": field_name, "value": name, "suggestion": f"Try: {re.sub(r'[^a-zA-Z0-9_-]', '-', name)}"}
+            details={"field": field_name, "value": name, "suggestion": f"Try: {_NAME_SUGGESTION_RE.sub('-', name)}"}
         )
 
     # Must start with letter
@@ -129,11 +139,11 @@ def validate_topic_prefix(prefix: str) -> str:
     prefix = validate_required(prefix, "topic prefix")
     prefix = prefix.lower()
 
-    if not re.match(r'^[a-z][a-z0-9]*$', prefix):
+    if not _TOPIC_PREFIX_RE.match(prefix):
         raise ValidationError(
             "Topic prefix must be lowercase letters/numbers, starting with a letter",
             operation="validation",
-            details={"field": "topic prefix", "value": prefix, "suggestion": f"Try: {re.sub(r'[^a-z0-9]', '', prefix.lower())}"}
+            details={"field": "topic prefix", "value": prefix, "suggestion": f"Try: {_TOPIC_SUGGESTION_RE.sub('', prefix)}"}
         )
 
     if len(prefix) > 20:
@@ -175,25 +185,31 @@ def validate_path(
 
     resolved = Path(path).expanduser().resolve()
 
-    if must_exist and not resolved.exists():
+    # One stat() answers all three checks; None means the path does not exist
+    mode = None
+    if must_exist or must_be_dir or must_be_file:
+        try:
+            mode = resolved.stat().st_mode
+        except (OSError, ValueError):
+            pass
+
+    if must_exist and mode is None:
         raise ValidationError(
             f"{field_name} does not exist: {resolved}",
             operation="validation", details={"field": field_name, "value": str(resolved)}
         )
 
-    if must_be_dir:
-        if resolved.exists() and not resolved.is_dir():
-            raise ValidationError(
-                f"{field_name} is not a directory: {resolved}",
-                operation="validation", details={"field": field_name, "value": str(resolved)}
-            )
+    if must_be_dir and mode is not None and not stat.S_ISDIR(mode):
+        raise ValidationError(
+            f"{field_name} is not a directory: {resolved}",
+            operation="validation", details={"field": field_name, "value": str(resolved)}
+        )
 
-    if must_be_file:
-        if resolved.exists() and not resolved.is_file():
-            raise ValidationError(
-                f"{field_name} is not a file: {resolved}",
-                operation="validation", details={"field": field_name, "value": str(resolved)}
-            )
+    if must_be_file and mode is not None and not stat.S_ISREG(mode):
+        raise ValidationError(
+            f"{field_name} is not a file: {resolved}",
+            operation="validation", details={"field": field_name, "value": str(resolved)}
+        )
 
     if create_parents and not resolved.parent.exists():
         resolved.parent.mkdir(parents=True, exist_ok=True)
@@ -245,27 +261,35 @@ def validate_url(
                 operation="validation", details={"field": field_name, "value": url}
             )
 
-    try:
-        parsed = urlparse(url)
-    except Exception as e:
-        raise ValidationError(
-            f"Invalid {field_name} format: {e}",
-            operation="validation", details={"field": field_name, "value": url}
-        ) from e
+    # Plain scheme://host URLs are split with one regex match; anything
+    # unusual (IPv6 brackets, non-ASCII, whitespace, control characters) goes
+    # to urlparse
+    match = _URL_PREFIX_RE.match(url)
+    if match:
+        scheme, netloc = match.group(1).lower(), match.group(2)
+    else:
+        try:
+            parsed = urlparse(url)
+        except Exception as e:
+            raise ValidationError(
+                f"Invalid {field_name} format: {e}",
+                operation="validation", details={"field": field_name, "value": url}
+            ) from e
+        scheme, netloc = parsed.scheme, parsed.netloc
 
-    if not parsed.scheme or parsed.scheme not in allowed_schemes:
+    if not scheme or scheme not in allowed_schemes:
         raise ValidationError(
-            f"{field_name} must use one of: {', '.join(allowed_schemes)} (got: {parsed.scheme})",
+            f"{field_name} must use one of: {', '.join(allowed_schemes)} (got: {scheme})",
             operation="validation", details={"field": field_name, "value": url}
         )
 
-    if require_https and parsed.scheme != 'https':
+    if require_https and scheme != 'https':
         raise ValidationError(
             f"{field_name} must use HTTPS",
             operation="validation", details={"field": field_name, "value": url}
         )
 
-    if not parsed.netloc:
+    if not netloc:
         raise ValidationError(
             f"{field_name} must include a host",
             operation="validation", details={"field": field_name, "value": url}
@@ -274,7 +298,7 @@ def validate_url(
     if allowed_domains:
         domain_match = False
         for domain_suffix in allowed_domains:
-            if parsed.netloc.endswith(domain_suffix):
+            if netloc.endswith(domain_suffix):
                 domain_match = True
                 break
         if not domain_match:
@@ -283,9 +307,9 @@ def validate_url(
                 operation="validation", details={"field": field_name, "value": url}
             )
 
-    # Basic hostname pattern (optional for very generic URL validation, parsed.netloc covers most)
+    # Basic hostname pattern (optional for very generic URL validation, netloc covers most)
     # pattern = r'^[a-zA-Z0-9][-a-zA-Z0-9.]*[a-zA-Z0-9](:[0-9]+)?$'
-    # if not re.match(pattern, parsed.netloc.split(':')[0]):
+    # if not re.match(pattern, netloc.split(':')[0]):
     #     raise ValidationError(f"Invalid {field_name} hostname format", field=field_name, value=url)
 
     return url.rstrip('/') # Normalize: remove trailing slash
@@ -313,8 +337,7 @@ def validate_email(
     email = email.strip().lower()
 
     # Basic email pattern - more comprehensive than just existence
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
+    if not _EMAIL_RE.match(email):
         raise ValidationError(
             f"{field_name} is not a valid email address",
             operation="validation", details={"field": field_name, "value": email}
@@ -6,14 +6,23 @@ Provides pytest hooks and shared fixtures for all tests.
 Hooks:
 - pytest_addoption: Adds --live CLI flag for running live API tests
 - pytest_configure: Registers markers programmatically
-- pytest_collection_modifyitems: Skips live tests unless --live flag is provided
+- pytest_collection_modifyitems: Deselects live tests unless --live flag is provided
 
 Fixtures:
-- mock_config: Sample configuration dictionary
+- mock_config: Sample configuration dictionary (session-scoped, read-only)
+- checkpoint_tmp: Per-test scratch directory for checkpoint files
+- empty_project_dir: Empty directory shared by read-only tests (session-scoped)
+- temp_cache_dir: Temporary directory for cache testing
+- clear_config_caches: Resets memoized .claude lookups and parsed settings (autouse)
 """
 
+import re
+from types import MappingProxyType
+
 import pytest
 
+from assistant_skills_lib import config_manager
+
 
 # =============================================================================
 # Pytest Hooks
@@ -30,35 +39,50 @@ def pytest_addoption(parser):
     )
 
 
-def pytest_configure(config):
-    """Register custom markers."""
+_MARKERS = (
     # Core markers
-    config.addinivalue_line("markers", "unit: Unit tests (fast, no external calls)")
-    config.addinivalue_line(
-        "markers", "integration: Integration tests (may require credentials)"
-    )
-    config.addinivalue_line("markers", "slow: Slow-running tests")
-    config.addinivalue_line("markers", "live: Tests requiring live API credentials")
-    config.addinivalue_line("markers", "destructive: Tests that modify or delete data")
-
+    ("unit", "Unit tests (fast, no external calls)"),
+    ("integration", "Integration tests (may require credentials)"),
+    ("slow", "Slow-running tests"),
+    ("live", "Tests requiring live API credentials"),
+    ("destructive", "Tests that modify or delete data"),
     # Component markers
-    config.addinivalue_line("markers", "cache: Cache tests")
-    config.addinivalue_line("markers", "config: Configuration tests")
-    config.addinivalue_line("markers", "credentials: Credential manager tests")
-    config.addinivalue_line("markers", "formatters: Output formatter tests")
-    config.addinivalue_line("markers", "validators: Input validator tests")
-    config.addinivalue_line("markers", "errors: Error handler tests")
-    config.addinivalue_line("markers", "templates: Template engine tests")
-    config.addinivalue_line("markers", "batch: Batch processor tests")
+    ("cache", "Cache tests"),
+    ("config", "Configuration tests"),
+    ("credentials", "Credential manager tests"),
+    ("formatters", "Output formatter tests"),
+    ("validators", "Input validator tests"),
+    ("errors", "Error handler tests"),
+    ("templates", "Template engine tests"),
+    ("batch", "Batch processor tests"),
+)
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    add = config.addinivalue_line
+    for name, description in _MARKERS:
+        add("markers", f"{name}: {description}")
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection based on CLI flags."""
-    if not config.getoption("--live"):
-        skip_live = pytest.mark.skip(reason="need --live option to run")
-        for item in items:
-            if "live" in item.keywords:
-                item.add_marker(skip_live)
+    if config.getoption("--live"):
+        return
+
+    keep = []
+    deselected = []
+    for item in items:
+        if item.get_closest_marker("live"):
+            deselected.append(item)
+        else:
+            keep.append(item)
+
+    if not deselected:
+        return
+
+    config.hook.pytest_deselected(items=deselected)
+    items[:] = keep
 
 
 # =============================================================================
@@ -66,16 +90,44 @@ def pytest_collection_modifyitems(config, items):
 # =============================================================================
 
 
-@pytest.fixture
+_MOCK_CONFIG = {
+    "site_url": "https://test.example.com",
+    "email": "test@example.com",
+    "api_token": "test-token",
+    "default_project": "TEST",
+    "page_size": 50,
+}
+
+
+@pytest.fixture(scope="session")
 def mock_config():
-    """Sample configuration dictionary for testing."""
-    return {
-        "site_url": "https://test.example.com",
-        "email": "test@example.com",
-        "api_token": "test-token",
-        "default_project": "TEST",
-        "page_size": 50,
-    }
+    """Sample configuration dictionary for testing.
+
+    Shared across the session and read-only; use ``dict(mock_config)`` to get
+    a mutable copy.
+    """
+    return MappingProxyType(_MOCK_CONFIG)
+
+
+@pytest.fixture
+def checkpoint_tmp(tmp_path_factory, request):
+    """Per-test scratch directory for checkpoint files.
+
+    Allocated directly under the session base temp directory, skipping the
+    extra bookkeeping that the function-scoped ``tmp_path`` fixture performs.
+    """
+    name = re.sub(r"\W", "_", request.node.name)[:30]
+    return tmp_path_factory.mktemp(name, numbered=True)
+
+
+@pytest.fixture(scope="session")
+def empty_project_dir(tmp_path_factory):
+    """Empty directory shared across the session.
+
+    Only for tests that inspect a directory without writing to it; anything
+    that creates files must use ``tmp_path`` instead.
+    """
+    return tmp_path_factory.mktemp("empty_project")
 
 
 @pytest.fixture
@@ -84,3 +136,13 @@ def temp_cache_dir(tmp_path):
     cache_dir = tmp_path / "cache"
     cache_dir.mkdir()
     return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_config_caches():
+    """Ensure memoized .claude lookups and settings parses do not leak between tests."""
+    config_manager._claude_dir_cache.clear()
+    config_manager._json_cache.clear()
+    yield
+    config_manager._claude_dir_cache.clear()
+    config_manager._json_cache.clear()
@@ -7,6 +7,28 @@ These tests prevent breaking changes to downstream packages like splunk-as and j
 
 import pytest
 
+import assistant_skills_lib
+from assistant_skills_lib import (
+    APIError,
+    AuthenticationError,
+    BaseAPIError,
+    Cache,
+    ConflictError,
+    InputValidationError,
+    NotFoundError,
+    PermissionError,
+    RateLimitError,
+    ServerError,
+    SkillCache,
+    ValidationError,
+    __all__,
+    get_cache,
+    get_skill_cache,
+)
+from assistant_skills_lib.config_manager import BaseConfigManager
+
+EXPECTED_ABSTRACT_METHODS = frozenset({"get_service_name", "get_default_config"})
+
 
 class TestBackwardsCompatibilityAliases:
     """Test that backwards compatibility aliases exist and work correctly."""
@@ -17,8 +39,6 @@ class TestBackwardsCompatibilityAliases:
         splunk-as calls BaseConfigManager._deep_merge() directly.
         Removing this alias would break that package.
         """
-        from assistant_skills_lib.config_manager import BaseConfigManager
-
         assert hasattr(BaseConfigManager, "_deep_merge"), (
             "_deep_merge alias removed but splunk-as depends on it. "
             "Add '_deep_merge = _merge_config' to maintain compatibility."
@@ -26,8 +46,6 @@ class TestBackwardsCompatibilityAliases:
 
     def test_deep_merge_alias_works(self):
         """_deep_merge should call _merge_config correctly."""
-        from assistant_skills_lib.config_manager import BaseConfigManager
-
         # Create a test subclass
         class TestConfigManager(BaseConfigManager):
             def get_service_name(self) -> str:
@@ -47,32 +65,24 @@ class TestBackwardsCompatibilityAliases:
 
     def test_cache_alias_exists(self):
         """Cache must alias SkillCache for backwards compatibility."""
-        from assistant_skills_lib import Cache, SkillCache
-
         assert Cache is SkillCache, (
             "Cache alias removed but downstream packages may use it"
         )
 
     def test_get_cache_alias_exists(self):
         """get_cache must alias get_skill_cache for backwards compatibility."""
-        from assistant_skills_lib import get_cache, get_skill_cache
-
         assert get_cache is get_skill_cache, (
             "get_cache alias removed but downstream packages may use it"
         )
 
     def test_api_error_alias_exists(self):
         """APIError must alias BaseAPIError for backwards compatibility."""
-        from assistant_skills_lib import APIError, BaseAPIError
-
         assert APIError is BaseAPIError, (
             "APIError alias removed but downstream packages may use it"
         )
 
     def test_input_validation_error_alias_exists(self):
         """InputValidationError must alias ValidationError for backwards compatibility."""
-        from assistant_skills_lib import InputValidationError, ValidationError
-
         assert InputValidationError is ValidationError, (
             "InputValidationError alias removed but downstream packages may use it"
         )
@@ -83,16 +93,10 @@ class TestPublicExports:
 
     def test_all_exports_importable(self):
         """Verify every name in __all__ can be imported."""
-        from assistant_skills_lib import __all__
-        import assistant_skills_lib
-
-        missing = []
-        for name in __all__:
-            if not hasattr(assistant_skills_lib, name):
-                missing.append(name)
+        missing = set(__all__) - set(vars(assistant_skills_lib))
 
         assert not missing, (
-            f"These names are in __all__ but not importable: {missing}"
+            f"These names are in __all__ but not importable: {sorted(missing)}"
         )
 
     def test_critical_exports_exist(self):
@@ -124,12 +128,8 @@ class TestPublicExports:
             "ValidationError",
         ]
 
-        import assistant_skills_lib
-
-        missing = []
-        for name in critical_exports:
-            if not hasattr(assistant_skills_lib, name):
-                missing.append(name)
+        exported = set(vars(assistant_skills_lib))
+        missing = [name for name in critical_exports if name not in exported]
 
         assert not missing, (
             f"Critical exports missing from assistant_skills_lib: {missing}"
@@ -141,24 +141,15 @@ class TestConfigManagerAPI:
 
     def test_required_abstract_methods(self):
         """BaseConfigManager must require these abstract methods."""
-        from assistant_skills_lib.config_manager import BaseConfigManager
-        import inspect
-
-        abstract_methods = {
-            name for name, method in inspect.getmembers(BaseConfigManager)
-            if getattr(method, "__isabstractmethod__", False)
-        }
+        abstract_methods = BaseConfigManager.__abstractmethods__
 
-        expected = {"get_service_name", "get_default_config"}
-        assert abstract_methods == expected, (
+        assert abstract_methods == EXPECTED_ABSTRACT_METHODS, (
             f"BaseConfigManager abstract methods changed. "
-            f"Expected {expected}, got {abstract_methods}"
+            f"Expected {set(EXPECTED_ABSTRACT_METHODS)}, got {set(abstract_methods)}"
         )
 
     def test_public_methods_exist(self):
         """BaseConfigManager must have these public methods."""
-        from assistant_skills_lib.config_manager import BaseConfigManager
-
         required_methods = [
             "get_api_config",
             "get_credential_from_env",
@@ -179,10 +170,9 @@ class TestConfigManagerAPI:
 class TestErrorHierarchy:
     """Test that error class hierarchy is stable."""
 
-    def test_error_inheritance(self):
-        """Error classes must inherit from correct base classes."""
-        from assistant_skills_lib import (
-            BaseAPIError,
+    @pytest.mark.parametrize(
+        "error_class",
+        [
             AuthenticationError,
             PermissionError,
             NotFoundError,
@@ -190,16 +180,13 @@ class TestErrorHierarchy:
             ValidationError,
             ConflictError,
             ServerError,
-        )
-
-        # All should inherit from BaseAPIError
-        assert issubclass(AuthenticationError, BaseAPIError)
-        assert issubclass(PermissionError, BaseAPIError)
-        assert issubclass(NotFoundError, BaseAPIError)
-        assert issubclass(RateLimitError, BaseAPIError)
-        assert issubclass(ValidationError, BaseAPIError)
-        assert issubclass(ConflictError, BaseAPIError)
-        assert issubclass(ServerError, BaseAPIError)
-
-        # BaseAPIError should be a Python Exception
+        ],
+        ids=lambda cls: cls.__name__,
+    )
+    def test_error_inheritance(self, error_class):
+        """Error classes must inherit from BaseAPIError."""
+        assert issubclass(error_class, BaseAPIError)
+
+    def test_base_error_is_exception(self):
+        """BaseAPIError should be a Python Exception."""
         assert issubclass(BaseAPIError, Exception)
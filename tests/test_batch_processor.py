@@ -1,10 +1,10 @@
 """Tests for batch_processor module."""
 
 import json
+import re
 import pytest
 from datetime import datetime
-from pathlib import Path
-from unittest.mock import patch
+from types import MappingProxyType
 
 from assistant_skills_lib.batch_processor import (
     BatchProgress,
@@ -16,6 +16,27 @@ from assistant_skills_lib.batch_processor import (
     list_pending_checkpoints,
 )
 
+INVALID_JSON_BYTES = b"invalid json {{{"
+NOT_VALID_JSON_BYTES = b"not valid json"
+ISO_TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+# Read-only skeleton of a serialized BatchProgress checkpoint; tests derive
+# their payloads with {**PROGRESS_TEMPLATE, ...}.
+PROGRESS_TEMPLATE = MappingProxyType(
+    {
+        "total_items": 100,
+        "processed_items": 0,
+        "successful_items": 0,
+        "failed_items": 0,
+        "current_batch": 0,
+        "total_batches": 1,
+        "started_at": "2024-01-15T10:00:00",
+        "updated_at": "2024-01-15T10:01:00",
+        "errors": {},
+        "processed_keys": [],
+    }
+)
+
 
 class TestBatchProgress:
     """Tests for BatchProgress dataclass and properties."""
@@ -77,34 +98,22 @@ class TestBatchConfig:
         assert config.max_items == 10000
         assert config.enable_checkpoints is True
 
-    def test_batch_size_clamp_min(self):
-        """Test batch_size is clamped to minimum 1."""
-        config = BatchConfig(batch_size=0)
-        assert config.batch_size == 1
-
-        config = BatchConfig(batch_size=-5)
-        assert config.batch_size == 1
-
-    def test_batch_size_clamp_max(self):
-        """Test batch_size is clamped to maximum 500."""
-        config = BatchConfig(batch_size=1000)
-        assert config.batch_size == 500
-
-    def test_delay_between_batches_clamp(self):
-        """Test delay_between_batches is clamped to valid range."""
-        config = BatchConfig(delay_between_batches=-1.0)
-        assert config.delay_between_batches == 0.0
-
-        config = BatchConfig(delay_between_batches=100.0)
-        assert config.delay_between_batches == 60.0
-
-    def test_delay_between_items_clamp(self):
-        """Test delay_between_items is clamped to valid range."""
-        config = BatchConfig(delay_between_items=-1.0)
-        assert config.delay_between_items == 0.0
-
-        config = BatchConfig(delay_between_items=20.0)
-        assert config.delay_between_items == 10.0
+    @pytest.mark.parametrize(
+        "field_name,value,expected",
+        [
+            ("batch_size", 0, 1),
+            ("batch_size", -5, 1),
+            ("batch_size", 1000, 500),
+            ("delay_between_batches", -1.0, 0.0),
+            ("delay_between_batches", 100.0, 60.0),
+            ("delay_between_items", -1.0, 0.0),
+            ("delay_between_items", 20.0, 10.0),
+        ],
+    )
+    def test_clamps_to_valid_range(self, field_name, value, expected):
+        """Test out-of-range values are clamped to the valid range."""
+        config = BatchConfig(**{field_name: value})
+        assert getattr(config, field_name) == expected
 
     def test_default_checkpoint_dir(self):
         """Test default checkpoint directory is set."""
@@ -114,63 +123,68 @@ class TestBatchConfig:
         assert "checkpoints" in config.checkpoint_dir
 
 
+@pytest.fixture(scope="module")
+def empty_checkpoint_mgr(tmp_path_factory):
+    """Shared CheckpointManager that never has a checkpoint saved.
+
+    Only use this in tests that do not call save().
+    """
+    return CheckpointManager(tmp_path_factory.mktemp("checkpoints"), "empty-op")
+
+
 class TestCheckpointManager:
     """Tests for CheckpointManager class."""
 
-    def test_init_creates_directory(self, tmp_path):
+    def test_init_creates_directory(self, checkpoint_tmp):
         """Test initialization creates checkpoint directory."""
-        checkpoint_dir = tmp_path / "checkpoints"
+        checkpoint_dir = checkpoint_tmp / "checkpoints"
         assert not checkpoint_dir.exists()
 
-        mgr = CheckpointManager(str(checkpoint_dir), "test-op")
+        mgr = CheckpointManager(checkpoint_dir, "test-op")
 
         assert checkpoint_dir.exists()
         assert mgr.operation_id == "test-op"
 
-    def test_exists_false(self, tmp_path):
+    def test_exists_false(self, empty_checkpoint_mgr):
         """Test exists returns False when no checkpoint."""
-        mgr = CheckpointManager(str(tmp_path), "test-op")
-        assert mgr.exists() is False
-
-    def test_exists_true(self, tmp_path):
-        """Test exists returns True after save."""
-        mgr = CheckpointManager(str(tmp_path), "test-op")
-        progress = BatchProgress(total_items=10)
-        mgr.save(progress)
-        assert mgr.exists() is True
+        assert empty_checkpoint_mgr.exists() is False
 
-    def test_save_creates_file(self, tmp_path):
-        """Test save creates checkpoint file."""
-        mgr = CheckpointManager(str(tmp_path), "test-op")
+    def test_save_creates_file(self, checkpoint_tmp):
+        """Test save creates checkpoint file and exists returns True."""
+        mgr = CheckpointManager(checkpoint_tmp, "test-op")
         progress = BatchProgress(total_items=10, processed_items=5)
 
         mgr.save(progress)
 
-        checkpoint_file = tmp_path / "test-op.checkpoint.json"
+        checkpoint_file = checkpoint_tmp / "test-op.checkpoint.json"
         assert checkpoint_file.exists()
+        assert mgr.exists() is True
 
-    def test_save_updates_timestamp(self, tmp_path):
+    def test_save_updates_timestamp(self, checkpoint_tmp):
         """Test save updates updated_at timestamp."""
-        mgr = CheckpointManager(str(tmp_path), "test-op")
+        mgr = CheckpointManager(checkpoint_tmp, "test-op")
         progress = BatchProgress(total_items=10)
         assert progress.updated_at == ""
 
         mgr.save(progress)
 
         assert progress.updated_at != ""
-        # Verify it's a valid ISO format
-        datetime.fromisoformat(progress.updated_at)
-
-    def test_load_returns_progress(self, tmp_path):
-        """Test load returns saved progress."""
-        mgr = CheckpointManager(str(tmp_path), "test-op")
-        progress = BatchProgress(
-            total_items=100,
-            processed_items=50,
-            successful_items=45,
-            failed_items=5,
+        # Verify it's in ISO format
+        assert ISO_TIMESTAMP_RE.match(progress.updated_at)
+
+    def test_load_returns_progress(self, checkpoint_tmp):
+        """Test load returns progress saved to disk by another manager."""
+        CheckpointManager(checkpoint_tmp, "test-op").save(
+            BatchProgress(
+                total_items=100,
+                processed_items=50,
+                successful_items=45,
+                failed_items=5,
+                errors={"k1": "boom"},
+                processed_keys=["k1", "k2"],
+            )
         )
-        mgr.save(progress)
+        mgr = CheckpointManager(checkpoint_tmp, "test-op")
 
         loaded = mgr.load()
 
@@ -179,23 +193,24 @@ class TestCheckpointManager:
         assert loaded.processed_items == 50
         assert loaded.successful_items == 45
         assert loaded.failed_items == 5
+        assert loaded.errors == {"k1": "boom"}
+        assert loaded.processed_keys == ["k1", "k2"]
 
-    def test_load_returns_none_when_missing(self, tmp_path):
+    def test_load_returns_none_when_missing(self, empty_checkpoint_mgr):
         """Test load returns None when no checkpoint file."""
-        mgr = CheckpointManager(str(tmp_path), "nonexistent-op")
-        assert mgr.load() is None
+        assert empty_checkpoint_mgr.load() is None
 
-    def test_load_returns_none_on_invalid_json(self, tmp_path):
+    def test_load_returns_none_on_invalid_json(self, checkpoint_tmp):
         """Test load returns None for invalid JSON."""
-        mgr = CheckpointManager(str(tmp_path), "test-op")
-        checkpoint_file = tmp_path / "test-op.checkpoint.json"
-        checkpoint_file.write_text("invalid json {{{")
+        mgr = CheckpointManager(checkpoint_tmp, "test-op")
+        checkpoint_file = checkpoint_tmp / "test-op.checkpoint.json"
+        checkpoint_file.write_bytes(INVALID_JSON_BYTES)
 
         assert mgr.load() is None
 
-    def test_clear_removes_file(self, tmp_path):
+    def test_clear_removes_file(self, checkpoint_tmp):
         """Test clear removes checkpoint file."""
-        mgr = CheckpointManager(str(tmp_path), "test-op")
+        mgr = CheckpointManager(checkpoint_tmp, "test-op")
         progress = BatchProgress(total_items=10)
         mgr.save(progress)
         assert mgr.exists() is True
@@ -204,11 +219,10 @@ class TestCheckpointManager:
 
         assert mgr.exists() is False
 
-    def test_clear_no_error_when_missing(self, tmp_path):
+    def test_clear_no_error_when_missing(self, empty_checkpoint_mgr):
         """Test clear does not raise error when file missing."""
-        mgr = CheckpointManager(str(tmp_path), "test-op")
-        assert mgr.exists() is False
-        mgr.clear()  # Should not raise
+        assert empty_checkpoint_mgr.exists() is False
+        empty_checkpoint_mgr.clear()  # Should not raise
 
 
 class TestGenerateOperationId:
@@ -235,83 +249,60 @@ class TestGenerateOperationId:
 class TestGetRecommendedBatchSize:
     """Tests for get_recommended_batch_size function."""
 
-    def test_simple_operation(self):
-        """Test batch size for simple operations."""
-        size = get_recommended_batch_size(100, "simple")
-        assert size == 100
-
-    def test_complex_operation(self):
-        """Test batch size for complex operations."""
-        size = get_recommended_batch_size(100, "complex")
-        assert size == 50
-
-    def test_create_operation(self):
-        """Test batch size for create operations."""
-        size = get_recommended_batch_size(100, "create")
-        assert size == 25
-
-    def test_delete_operation(self):
-        """Test batch size for delete operations."""
-        size = get_recommended_batch_size(100, "delete")
-        assert size == 50
-
-    def test_unknown_operation_type(self):
-        """Test unknown operation type uses default."""
-        size = get_recommended_batch_size(100, "unknown")
-        assert size == 50
-
-    def test_large_item_count_reduces_size(self):
-        """Test that large item counts reduce batch size."""
-        # Over 5000 items -> half size
-        size = get_recommended_batch_size(6000, "simple")
-        assert size == 50  # 100 / 2
-
-    def test_medium_item_count_reduces_size(self):
-        """Test that medium item counts reduce batch size."""
-        # Over 1000 items -> 3/4 size
-        size = get_recommended_batch_size(1500, "simple")
-        assert size == 75  # 100 * 3/4
-
-    def test_minimum_batch_size(self):
-        """Test batch size doesn't go below 25."""
-        # create (25) with large items -> 25/2 = 12, but min is 25
-        size = get_recommended_batch_size(10000, "create")
-        assert size == 25
+    @pytest.mark.parametrize(
+        "total_items,operation_type,expected",
+        [
+            (100, "simple", 100),
+            (100, "complex", 50),
+            (100, "create", 25),
+            (100, "delete", 50),
+            # Unknown operation type uses default
+            (100, "unknown", 50),
+            # Over 5000 items -> half size
+            (6000, "simple", 50),
+            # Over 1000 items -> 3/4 size
+            (1500, "simple", 75),
+            # create (25) with large items -> 25/2 = 12, but min is 25
+            (10000, "create", 25),
+        ],
+    )
+    def test_recommended_batch_size(self, total_items, operation_type, expected):
+        """Test batch size by operation type and item count."""
+        assert get_recommended_batch_size(total_items, operation_type) == expected
+
+
+def write_checkpoint(path, data):
+    """Write checkpoint data to path as UTF-8 encoded JSON bytes."""
+    path.write_bytes(json.dumps(data).encode())
 
 
 class TestListPendingCheckpoints:
     """Tests for list_pending_checkpoints function."""
 
-    def test_empty_when_no_dir(self, tmp_path):
+    def test_empty_when_no_dir(self, checkpoint_tmp):
         """Test returns empty list when directory doesn't exist."""
-        nonexistent = tmp_path / "nonexistent"
-        result = list_pending_checkpoints(str(nonexistent))
+        nonexistent = checkpoint_tmp / "nonexistent"
+        result = list_pending_checkpoints(nonexistent)
         assert result == []
 
-    def test_empty_when_no_checkpoints(self, tmp_path):
+    def test_empty_when_no_checkpoints(self, checkpoint_tmp):
         """Test returns empty list when no checkpoint files."""
-        result = list_pending_checkpoints(str(tmp_path))
+        result = list_pending_checkpoints(checkpoint_tmp)
         assert result == []
 
-    def test_finds_pending_checkpoints(self, tmp_path):
+    def test_finds_pending_checkpoints(self, checkpoint_tmp):
         """Test finds pending (incomplete) checkpoints."""
         # Create a pending checkpoint
         progress = {
-            "total_items": 100,
+            **PROGRESS_TEMPLATE,
             "processed_items": 50,
             "successful_items": 50,
-            "failed_items": 0,
             "current_batch": 1,
             "total_batches": 2,
-            "started_at": "2024-01-15T10:00:00",
-            "updated_at": "2024-01-15T10:01:00",
-            "errors": {},
-            "processed_keys": [],
         }
-        checkpoint_file = tmp_path / "test-op.checkpoint.json"
-        checkpoint_file.write_text(json.dumps(progress))
+        write_checkpoint(checkpoint_tmp / "test-op.checkpoint.json", progress)
 
-        result = list_pending_checkpoints(str(tmp_path))
+        result = list_pending_checkpoints(checkpoint_tmp)
 
         assert len(result) == 1
         assert result[0]["operation_id"] == "test-op"
@@ -319,69 +310,56 @@ class TestListPendingCheckpoints:
         assert result[0]["processed"] == 50
         assert result[0]["total"] == 100
 
-    def test_ignores_complete_checkpoints(self, tmp_path):
+    def test_ignores_complete_checkpoints(self, checkpoint_tmp):
         """Test ignores completed checkpoints."""
         # Create a complete checkpoint
         progress = {
-            "total_items": 100,
+            **PROGRESS_TEMPLATE,
             "processed_items": 100,
             "successful_items": 100,
-            "failed_items": 0,
             "current_batch": 2,
             "total_batches": 2,
-            "started_at": "2024-01-15T10:00:00",
-            "updated_at": "2024-01-15T10:01:00",
-            "errors": {},
-            "processed_keys": [],
         }
-        checkpoint_file = tmp_path / "complete-op.checkpoint.json"
-        checkpoint_file.write_text(json.dumps(progress))
+        write_checkpoint(checkpoint_tmp / "complete-op.checkpoint.json", progress)
 
-        result = list_pending_checkpoints(str(tmp_path))
+        result = list_pending_checkpoints(checkpoint_tmp)
 
         assert len(result) == 0
 
-    def test_ignores_invalid_json(self, tmp_path):
+    def test_ignores_invalid_json(self, checkpoint_tmp):
         """Test ignores files with invalid JSON."""
-        checkpoint_file = tmp_path / "invalid.checkpoint.json"
-        checkpoint_file.write_text("not valid json")
+        checkpoint_file = checkpoint_tmp / "invalid.checkpoint.json"
+        checkpoint_file.write_bytes(NOT_VALID_JSON_BYTES)
 
-        result = list_pending_checkpoints(str(tmp_path))
+        result = list_pending_checkpoints(checkpoint_tmp)
 
         assert len(result) == 0
 
-    def test_sorted_by_updated_at_descending(self, tmp_path):
+    def test_sorted_by_updated_at_descending(self, checkpoint_tmp):
         """Test results are sorted by updated_at in descending order."""
         # Create two pending checkpoints with different timestamps
         old_progress = {
-            "total_items": 100,
+            **PROGRESS_TEMPLATE,
             "processed_items": 25,
             "successful_items": 25,
-            "failed_items": 0,
             "current_batch": 1,
             "total_batches": 4,
             "started_at": "2024-01-15T09:00:00",
             "updated_at": "2024-01-15T09:01:00",
-            "errors": {},
-            "processed_keys": [],
         }
         new_progress = {
-            "total_items": 100,
+            **PROGRESS_TEMPLATE,
             "processed_items": 75,
             "successful_items": 75,
-            "failed_items": 0,
             "current_batch": 3,
             "total_batches": 4,
-            "started_at": "2024-01-15T10:00:00",
             "updated_at": "2024-01-15T10:30:00",
-            "errors": {},
-            "processed_keys": [],
         }
 
-        (tmp_path / "old-op.checkpoint.json").write_text(json.dumps(old_progress))
-        (tmp_path / "new-op.checkpoint.json").write_text(json.dumps(new_progress))
+        write_checkpoint(checkpoint_tmp / "old-op.checkpoint.json", old_progress)
+        write_checkpoint(checkpoint_tmp / "new-op.checkpoint.json", new_progress)
 
-        result = list_pending_checkpoints(str(tmp_path))
+        result = list_pending_checkpoints(checkpoint_tmp)
 
         assert len(result) == 2
         # Newer should be first
@@ -389,10 +367,26 @@ class TestListPendingCheckpoints:
         assert result[1]["operation_id"] == "old-op"
 
 
+@pytest.fixture
+def make_processor():
+    """Factory for BatchProcessors with no delays and checkpoints disabled."""
+
+    def _make(process_item, **config_overrides):
+        config = BatchConfig(
+            delay_between_batches=0,
+            delay_between_items=0,
+            enable_checkpoints=False,
+            **config_overrides,
+        )
+        return BatchProcessor(config=config, process_item=process_item)
+
+    return _make
+
+
 class TestBatchProcessor:
     """Tests for BatchProcessor class."""
 
-    def test_process_all_items(self, tmp_path):
+    def test_process_all_items(self, make_processor):
         """Test processing all items successfully."""
         items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
         processed = []
@@ -401,13 +395,7 @@ class TestBatchProcessor:
             processed.append(item["id"])
             return True
 
-        config = BatchConfig(
-            batch_size=10,
-            delay_between_batches=0,
-            delay_between_items=0,
-            enable_checkpoints=False,
-        )
-        processor = BatchProcessor(config=config, process_item=process_item)
+        processor = make_processor(process_item, batch_size=10)
         result = processor.process(items, get_key=lambda x: x["id"])
 
         assert result.total_items == 3
@@ -416,7 +404,7 @@ class TestBatchProcessor:
         assert result.failed_items == 0
         assert processed == ["1", "2", "3"]
 
-    def test_dry_run_does_not_process(self, tmp_path):
+    def test_dry_run_does_not_process(self, make_processor):
         """Test dry run does not actually process items."""
         items = [{"id": "1"}, {"id": "2"}]
         processed = []
@@ -425,33 +413,27 @@ class TestBatchProcessor:
             processed.append(item["id"])
             return True
 
-        config = BatchConfig(enable_checkpoints=False)
-        processor = BatchProcessor(config=config, process_item=process_item)
+        processor = make_processor(process_item)
         result = processor.process(items, get_key=lambda x: x["id"], dry_run=True)
 
         assert result.total_items == 2
         assert len(processed) == 0
 
-    def test_handles_processing_failure(self, tmp_path):
+    def test_handles_processing_failure(self, make_processor):
         """Test handling of items that fail processing."""
         items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
 
         def process_item(item):
             return item["id"] != "2"  # Item 2 fails
 
-        config = BatchConfig(
-            delay_between_batches=0,
-            delay_between_items=0,
-            enable_checkpoints=False,
-        )
-        processor = BatchProcessor(config=config, process_item=process_item)
+        processor = make_processor(process_item)
         result = processor.process(items, get_key=lambda x: x["id"])
 
         assert result.successful_items == 2
         assert result.failed_items == 1
         assert "2" in result.errors
 
-    def test_handles_processing_exception(self, tmp_path):
+    def test_handles_processing_exception(self, make_processor):
         """Test handling of exceptions during processing."""
         items = [{"id": "1"}, {"id": "2"}]
 
@@ -460,29 +442,18 @@ class TestBatchProcessor:
                 raise ValueError("Test error")
             return True
 
-        config = BatchConfig(
-            delay_between_batches=0,
-            delay_between_items=0,
-            enable_checkpoints=False,
-        )
-        processor = BatchProcessor(config=config, process_item=process_item)
+        processor = make_processor(process_item)
         result = processor.process(items, get_key=lambda x: x["id"])
 
         assert result.successful_items == 1
         assert result.failed_items == 1
         assert "Test error" in result.errors["2"]
 
-    def test_respects_max_items(self, tmp_path):
+    def test_respects_max_items(self, make_processor):
         """Test max_items limit is respected."""
         items = [{"id": str(i)} for i in range(100)]
 
-        config = BatchConfig(
-            max_items=10,
-            delay_between_batches=0,
-            delay_between_items=0,
-            enable_checkpoints=False,
-        )
-        processor = BatchProcessor(config=config, process_item=lambda x: True)
+        processor = make_processor(lambda x: True, max_items=10)
         result = processor.process(items, get_key=lambda x: x["id"])
 
         assert result.total_items == 10
@@ -1,4 +1,5 @@
 import pytest
+import json
 import os
 import time
 import sqlite3
@@ -6,14 +7,32 @@ from pathlib import Path
 from datetime import timedelta
 from unittest.mock import patch
 
-from assistant_skills_lib.cache import SkillCache, get_skill_cache, CacheStats
+from assistant_skills_lib.cache import SkillCache, get_skill_cache, CacheStats, glob_prefix_range
+
+class FakeClock:
+    """Manually advanced clock for deterministic TTL tests."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
 
 @pytest.fixture
-def cache_instance(tmp_path):
+def clock():
+    """Fixture providing a FakeClock."""
+    return FakeClock()
+
+@pytest.fixture
+def cache_instance(tmp_path, clock):
     """Fixture to create a SkillCache instance with a temporary directory."""
-    cache = SkillCache(cache_name="test_cache", cache_dir=str(tmp_path))
+    cache = SkillCache(cache_name="test_cache", cache_dir=str(tmp_path), clock=clock)
     yield cache
     cache.clear()
+    cache.close()
 
 def test_cache_init_creates_files(tmp_path):
     """Test that SkillCache initialization creates the directory and db file."""
@@ -37,23 +56,58 @@ def test_set_and_get(cache_instance):
     # Test getting a non-existent key
     assert cache_instance.get("nonexistent", "category1") is None
 
-def test_cache_expiration(cache_instance):
+def test_large_value_is_compressed(cache_instance):
+    """Test that large values round-trip and are stored compressed."""
+    value = {"items": [{"id": i, "name": f"item-{i}"} for i in range(200)]}
+    cache_instance.set("big", value)
+
+    assert cache_instance.get("big") == value
+    stats = cache_instance.get_stats()
+    assert stats.total_size_bytes < len(json.dumps(value, separators=(",", ":")))
+
+def test_close_and_reuse(cache_instance):
+    """Test that a closed cache reopens its connection on next use."""
+    cache_instance.set("key1", "data")
+    cache_instance.close()
+    assert cache_instance.get("key1") == "data"
+
+def test_cache_expiration(cache_instance, clock):
     """Test that cache entries expire after their TTL."""
-    cache_instance.set("key_expire", "data", ttl=timedelta(seconds=0.01))
-    time.sleep(0.02)
+    cache_instance.set("key_expire", "data", ttl=timedelta(seconds=10))
+    clock.advance(9)
+    assert cache_instance.get("key_expire") == "data"
+    clock.advance(2)
     assert cache_instance.get("key_expire") is None
 
-def test_category_ttl_defaults(cache_instance):
+def test_default_clock_expiration(tmp_path):
+    """Test expiry with the default wall clock."""
+    cache = SkillCache(cache_name="wall_clock", cache_dir=str(tmp_path))
+    cache.set("key_expire", "data", ttl=timedelta(seconds=0.01))
+    time.sleep(0.02)
+    assert cache.get("key_expire") is None
+
+def test_ttl_in_seconds(cache_instance, clock):
+    """Test that TTLs can be given as plain seconds."""
+    cache_instance.set_ttl_defaults({"short": 10})
+    cache_instance.set("key_seconds", "data", ttl=10)
+    cache_instance.set("key_short", "data", category="short")
+    cache_instance.set("key_long", "data", ttl=3600)
+    clock.advance(20)
+    assert cache_instance.get("key_seconds") is None
+    assert cache_instance.get("key_short", "short") is None
+    assert cache_instance.get("key_long") == "data"
+
+def test_category_ttl_defaults(cache_instance, clock):
     """Test that different categories can have different default TTLs."""
     cache_instance.set_ttl_defaults({
-        "short": timedelta(seconds=0.01),
+        "short": timedelta(seconds=10),
         "long": timedelta(hours=1)
     })
     
     cache_instance.set("key_short", "data", category="short")
     cache_instance.set("key_long", "data", category="long")
     
-    time.sleep(0.02)
+    clock.advance(20)
     
     assert cache_instance.get("key_short", "short") is None
     assert cache_instance.get("key_long", "long") is not None
@@ -78,6 +132,39 @@ def test_lru_eviction(tmp_path):
     assert cache.get("key3") is not None
     assert cache.get("key4") is not None
 
+def test_lru_eviction_frees_only_needed_space(tmp_path):
+    """Test that eviction removes just enough of the oldest entries."""
+    cache = SkillCache(cache_name="lru_multi", cache_dir=str(tmp_path), max_size_mb=0.001)  # 1048 bytes
+
+    for i in range(1, 6):
+        cache.set(f"key{i}", str(i) * 200)  # 202 bytes each, 1010 total
+
+    # Needs 1010 + 602 - 1048 = 564 bytes: the three oldest entries go
+    cache.set("big", "x" * 600)
+
+    assert [cache.get(f"key{i}") is None for i in range(1, 6)] == [True, True, True, False, False]
+    assert cache.get("big") is not None
+
+def test_failed_set_rolls_back_eviction(tmp_path):
+    """Test that eviction from a failed set() is not committed by a later write."""
+    cache = SkillCache(cache_name="rollback", cache_dir=str(tmp_path), max_size_mb=0.001)  # 1048 bytes
+    for i in range(1, 6):
+        cache.set(f"key{i}", str(i) * 200)
+
+    evict = cache._evict_if_needed
+
+    def evict_then_fail(conn, size):
+        evict(conn, size)
+        raise sqlite3.OperationalError("disk I/O error")
+
+    with patch.object(cache, "_evict_if_needed", side_effect=evict_then_fail):
+        with pytest.raises(sqlite3.OperationalError):
+            cache.set("big", "x" * 600)
+
+    cache.invalidate(key="key5", category="default")
+    assert [cache.get(f"key{i}") is not None for i in range(1, 5)] == [True] * 4
+    cache.close()
+
 def test_invalidate_specific_key(cache_instance):
     """Test invalidating a single key."""
     cache_instance.set("key1", "data", "cat1")
@@ -114,6 +201,47 @@ def test_invalidate_complex_pattern(cache_instance):
     assert cache_instance.get("file3.txt") is not None
 
 
+@pytest.mark.parametrize("pattern", ["proj-1-*", "proj-?-*"])
+def test_invalidate_simple_pattern_ignores_case(cache_instance, pattern):
+    """Test that prefix and other simple globs both match ASCII case-insensitively."""
+    cache_instance.set("proj-1-a", "data")
+    cache_instance.set("Proj-1-b", "data")
+
+    assert cache_instance.invalidate(pattern=pattern) == 2
+
+def test_invalidate_uncased_prefix_range(cache_instance):
+    """Test that uncased prefixes, which use a key range, delete only their keys."""
+    cache_instance.set("123-a", "data")
+    cache_instance.set("123.b", "data")
+    cache_instance.set("\ud7ff-x", "data")
+
+    assert cache_instance.invalidate(pattern="123-*") == 1
+    assert cache_instance.get("123.b") is not None
+    assert cache_instance.invalidate(pattern="\ud7ff*") == 1
+
+def test_invalidate_pattern_with_backslash(cache_instance):
+    """Test that backslashes in patterns are matched literally."""
+    cache_instance.set("dir\\file1", "data")
+    cache_instance.set("dir\\file2", "data")
+
+    assert cache_instance.invalidate(pattern="dir\\file?") == 2
+
+@pytest.mark.parametrize("pattern,expected", [
+    ("123-*", ("123-", "123.")),
+    ("*", ("", None)),
+    ("proj-1-*", None),
+    ("\ud7ff*", None),
+    ("\U0010ffff*", None),
+    ("proj-*-details", None),
+    ("proj-?*", None),
+    ("file[1-2]*", None),
+    ("exact-key", None),
+])
+def test_glob_prefix_range(pattern, expected):
+    """Test conversion of prefix globs to key ranges."""
+    assert glob_prefix_range(pattern) == expected
+
+
 def test_invalidate_by_category(cache_instance):
     """Test invalidating an entire category."""
     cache_instance.set("key1", "data", "cat_A")
@@ -169,6 +297,7 @@ def test_generate_key_hashing():
     assert key.startswith("long_cat:")
     assert key != f"long_cat:{long_arg}"
     
+@pytest.mark.slow
 def test_get_skill_cache_factory():
     """Test the get_skill_cache factory function."""
     cache1 = get_skill_cache("my_cache")
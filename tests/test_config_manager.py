@@ -5,12 +5,14 @@ from pathlib import Path
 from typing import Dict, Any
 from unittest.mock import patch, mock_open
 
+from assistant_skills_lib import config_manager
 from assistant_skills_lib.config_manager import BaseConfigManager
 from assistant_skills_lib.error_handler import ValidationError # Assuming ValidationError is imported or aliased correctly
 
 
-def create_test_config_manager_class():
-    """Factory to create a fresh TestConfigManager class for each test."""
+@pytest.fixture(scope="module")
+def config_manager_cls():
+    """Concrete BaseConfigManager subclass, built once per module."""
     class _TestConfigManager(BaseConfigManager):
         def get_service_name(self) -> str:
             return "testservice"
@@ -23,7 +25,8 @@ def create_test_config_manager_class():
                     "timeout": 10
                 }
             }
-    return _TestConfigManager
+    yield _TestConfigManager
+    _TestConfigManager.reset_instance()
 
 @pytest.fixture
 def mock_claude_dir(tmp_path):
@@ -44,50 +47,112 @@ def create_settings_files(mock_claude_dir):
 
 @patch.dict(os.environ, {}, clear=True)
 @patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
-def test_init_basic(mock_find_dir):
-    TestConfigManager = create_test_config_manager_class()
-    manager = TestConfigManager()
+def test_init_basic(mock_find_dir, config_manager_cls):
+    manager = config_manager_cls()
     assert manager.service_name == "testservice"
     assert manager.env_prefix == "TESTSERVICE"
 
 
-def test_find_claude_dir_success(mock_claude_dir):
-    TestConfigManager = create_test_config_manager_class()
+def test_find_claude_dir_success(mock_claude_dir, config_manager_cls):
     with patch('pathlib.Path.cwd', return_value=mock_claude_dir / "subdir"):
         (mock_claude_dir / "subdir").mkdir()
-        manager = TestConfigManager()
+        manager = config_manager_cls()
         assert manager._find_claude_dir() == mock_claude_dir
 
-def test_find_claude_dir_none(tmp_path):
-    TestConfigManager = create_test_config_manager_class()
+def test_find_claude_dir_memoized(mock_claude_dir, config_manager_cls):
+    (mock_claude_dir / "subdir").mkdir()
+    with patch('pathlib.Path.cwd', return_value=mock_claude_dir / "subdir"):
+        manager = config_manager_cls()
+        assert manager._find_claude_dir() == mock_claude_dir
+        with patch('pathlib.Path.is_dir', autospec=True, return_value=True) as mock_is_dir:
+            assert manager._find_claude_dir() == mock_claude_dir
+        # Only the cached hit is revalidated; the tree above it is not walked again
+        mock_is_dir.assert_called_once_with(mock_claude_dir)
+
+
+def test_find_claude_dir_nearer_dir_after_hit(mock_claude_dir, config_manager_cls):
+    # No cache clearing between lookups: a .claude created below a cached hit wins
+    subdir = mock_claude_dir.parent / "subdir"
+    subdir.mkdir()
+    with patch('pathlib.Path.cwd', return_value=subdir):
+        manager = config_manager_cls()
+        assert manager._find_claude_dir() == mock_claude_dir
+        (subdir / ".claude").mkdir()
+        assert manager._find_claude_dir() == subdir / ".claude"
+        assert manager._find_claude_dir() == subdir / ".claude"
+
+
+def test_find_claude_dir_memoized_hit_revalidated(tmp_path, config_manager_cls):
+    claude_dir = tmp_path / ".claude"
+    claude_dir.mkdir()
+    with patch('pathlib.Path.cwd', return_value=tmp_path), \
+         patch('pathlib.Path.home', return_value=tmp_path):
+        manager = config_manager_cls()
+        assert manager._find_claude_dir() == claude_dir
+        claude_dir.rmdir()
+        assert manager._find_claude_dir() is None
+
+
+def test_find_claude_dir_none(tmp_path, config_manager_cls):
     # Patch home to be tmp_path so we don't find any .claude dirs
     with patch('pathlib.Path.cwd', return_value=tmp_path), \
          patch('pathlib.Path.home', return_value=tmp_path):
-        manager = TestConfigManager()
+        manager = config_manager_cls()
+        assert manager._find_claude_dir() is None
+
+def test_find_claude_dir_miss_not_remembered(tmp_path, config_manager_cls):
+    # No cache clearing between lookups: a .claude created after a miss is found
+    with patch('pathlib.Path.cwd', return_value=tmp_path), \
+         patch('pathlib.Path.home', return_value=tmp_path):
+        manager = config_manager_cls()
         assert manager._find_claude_dir() is None
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        (claude_dir / "settings.json").write_text(json.dumps({"testservice": {"url": "http://found.com"}}))
+        assert manager._find_claude_dir() == claude_dir
+        assert config_manager_cls().config["testservice"]["url"] == "http://found.com"
 
 @patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
-def test_load_config_no_files(mock_find_dir):
-    TestConfigManager = create_test_config_manager_class()
-    manager = TestConfigManager()
+def test_load_config_no_files(mock_find_dir, config_manager_cls):
+    manager = config_manager_cls()
     config = manager._load_config()
     assert config == {"testservice": manager.get_default_config()}
 
-def test_load_config_settings_json(mock_claude_dir, create_settings_files):
-    TestConfigManager = create_test_config_manager_class()
+def test_load_config_settings_json(mock_claude_dir, create_settings_files, config_manager_cls):
     create_settings_files(settings_content={
         "testservice": {"url": "http://settings.com", "extra_key": "extra_value"}
     })
-    with patch.object(TestConfigManager, '_find_claude_dir', return_value=mock_claude_dir):
-        manager = TestConfigManager()
+    with patch.object(config_manager_cls, '_find_claude_dir', return_value=mock_claude_dir):
+        manager = config_manager_cls()
         config = manager._load_config()
         assert config["testservice"]["url"] == "http://settings.com"
         assert config["testservice"]["extra_key"] == "extra_value"
         assert config["testservice"]["api_key"] == "default_key"  # Default is still there
 
 
-def test_load_config_local_overrides(mock_claude_dir, create_settings_files):
-    TestConfigManager = create_test_config_manager_class()
+def test_load_config_malformed_local_ignored(mock_claude_dir, create_settings_files, config_manager_cls):
+    create_settings_files(settings_content={"testservice": {"url": "http://settings.com"}})
+    (mock_claude_dir / "settings.local.json").write_text("{invalid json")
+    with patch.object(config_manager_cls, '_find_claude_dir', return_value=mock_claude_dir):
+        manager = config_manager_cls()
+        config = manager._load_config()
+        # Valid file is merged, malformed file is ignored
+        assert config["testservice"]["url"] == "http://settings.com"
+        assert config["testservice"]["api_key"] == "default_key"
+
+
+def test_load_config_accepts_what_json_accepts(mock_claude_dir, config_manager_cls):
+    # NaN/Infinity are not strict JSON, but json.load() reads them
+    (mock_claude_dir / "settings.json").write_text(
+        '{"testservice": {"url": "http://settings.com", "ratio": NaN, "limit": Infinity}}'
+    )
+    with patch.object(config_manager_cls, '_find_claude_dir', return_value=mock_claude_dir):
+        config = config_manager_cls()._load_config()["testservice"]
+    assert config["url"] == "http://settings.com"
+    assert config["limit"] == float("inf")
+
+
+def test_load_config_local_overrides(mock_claude_dir, create_settings_files, config_manager_cls):
     create_settings_files(
         settings_content={
             "testservice": {"url": "http://global.com"}
@@ -96,54 +161,155 @@ def test_load_config_local_overrides(mock_claude_dir, create_settings_files):
             "testservice": {"url": "http://local.com", "api_key": "local_key"}
         }
     )
-    with patch.object(TestConfigManager, '_find_claude_dir', return_value=mock_claude_dir):
-        manager = TestConfigManager()
+    with patch.object(config_manager_cls, '_find_claude_dir', return_value=mock_claude_dir):
+        manager = config_manager_cls()
         config = manager._load_config()
         assert config["testservice"]["url"] == "http://local.com"
         assert config["testservice"]["api_key"] == "local_key"
 
 
-def test_load_config_malformed_json(mock_claude_dir):
-    TestConfigManager = create_test_config_manager_class()
+def test_load_config_ignores_other_services(mock_claude_dir, create_settings_files, config_manager_cls):
+    create_settings_files(
+        settings_content={"otherservice": {"url": "http://other.com"}},
+        local_content={"testservice": None},
+    )
+    with patch.object(config_manager_cls, '_find_claude_dir', return_value=mock_claude_dir):
+        manager = config_manager_cls()
+        config = manager._load_config()
+        assert config == {"testservice": manager.get_default_config()}
+
+
+def test_load_config_reuses_parsed_settings(mock_claude_dir, create_settings_files, config_manager_cls):
+    create_settings_files(settings_content={"testservice": {"url": "http://settings.com"}})
+    # Only files last modified outside the racy window are cached
+    os.utime(mock_claude_dir / "settings.json", ns=(0, 0))
+    with patch.object(config_manager_cls, '_find_claude_dir', return_value=mock_claude_dir):
+        manager = config_manager_cls()
+        with patch.object(config_manager, '_load_json_file', wraps=config_manager._load_json_file) as mock_load:
+            manager._load_config()
+        mock_load.assert_not_called()
+        # Edits to the returned config must not leak into the parse cache
+        manager.config["testservice"]["url"] = "http://mutated.com"
+        assert manager._load_config()["testservice"]["url"] == "http://settings.com"
+
+
+def test_dump_json_matches_json_dump():
+    data = {"testservice": {"credentials": {"api_token": "secret"}, "name": "caf\u00e9",
+                            "ratio": float("nan"), "big": 1e100, "small": 1e-7}}
+    payload = config_manager._dump_json(data)
+    assert payload == json.dumps(data, indent=2).encode()
+    assert b'"ratio": NaN' in payload
+
+
+def test_read_bytes_handles_growth_after_stat(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_bytes(b"0123456789")
+    assert config_manager._read_bytes(path, 4) == b"0123456789"
+    assert config_manager._read_bytes(path, 10) == b"0123456789"
+
+
+def test_read_json_cached_detects_rewrite(tmp_path):
+    settings = tmp_path / "settings.json"
+    settings.write_text(json.dumps({"a": 1}))
+    assert config_manager._read_json_cached(settings) == {"a": 1}
+    settings.write_text(json.dumps({"a": 22}))
+    os.utime(settings, ns=(0, 0))
+    assert config_manager._read_json_cached(settings) == {"a": 22}
+
+
+def test_read_json_cached_detects_same_size_same_mtime_rewrite(tmp_path):
+    settings = tmp_path / "settings.json"
+    settings.write_text(json.dumps({"a": 1}))
+    os.utime(settings, ns=(0, 0))
+    assert config_manager._read_json_cached(settings) == {"a": 1}
+    # In-place rewrite with identical size and mtime; only ctime tells them apart
+    settings.write_text(json.dumps({"a": 2}))
+    os.utime(settings, ns=(0, 0))
+    assert config_manager._read_json_cached(settings) == {"a": 2}
+
+
+def test_read_json_cached_skips_recently_modified(tmp_path):
+    settings = tmp_path / "settings.json"
+    settings.write_text(json.dumps({"a": 1}))
+    with patch.object(config_manager, '_load_json_file', wraps=config_manager._load_json_file) as mock_load:
+        config_manager._read_json_cached(settings)
+        config_manager._read_json_cached(settings)
+    assert mock_load.call_count == 2
+    assert settings not in config_manager._json_cache
+
+
+def test_read_json_cached_is_bounded(tmp_path):
+    for i in range(config_manager._JSON_CACHE_MAX_ENTRIES + 5):
+        path = tmp_path / f"settings{i}.json"
+        path.write_text("{}")
+        os.utime(path, ns=(0, 0))
+        config_manager._read_json_cached(path)
+    assert len(config_manager._json_cache) == config_manager._JSON_CACHE_MAX_ENTRIES
+    assert tmp_path / "settings0.json" not in config_manager._json_cache
+
+
+@patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
+def test_merge_config_nested(mock_find_dir, config_manager_cls):
+    manager = config_manager_cls()
+    base = {"api": {"timeout": 10, "retry": {"max": 3, "backoff": 2.0}}, "url": "http://a"}
+    override = {"api": {"retry": {"max": 5}}, "url": "http://b", "extra": [1]}
+    result = manager._merge_config(base, override)
+    assert result == {
+        "api": {"timeout": 10, "retry": {"max": 5, "backoff": 2.0}},
+        "url": "http://b",
+        "extra": [1],
+    }
+    # Inputs are left untouched
+    assert base["api"]["retry"] == {"max": 3, "backoff": 2.0}
+    assert base["url"] == "http://a"
+
+
+def test_load_config_malformed_json(mock_claude_dir, config_manager_cls):
     (mock_claude_dir / "settings.json").write_text("{invalid json")
-    with patch.object(TestConfigManager, '_find_claude_dir', return_value=mock_claude_dir):
-        manager = TestConfigManager()
+    with patch.object(config_manager_cls, '_find_claude_dir', return_value=mock_claude_dir):
+        manager = config_manager_cls()
         config = manager._load_config()
         assert config == {"testservice": manager.get_default_config()}  # Should fallback to default
 
 
 @patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
-def test_get_api_config(mock_find_dir):
-    TestConfigManager = create_test_config_manager_class()
-    manager = TestConfigManager()
+def test_get_api_config(mock_find_dir, config_manager_cls):
+    manager = config_manager_cls()
     api_config = manager.get_api_config()
     assert api_config["timeout"] == 10
     assert api_config["max_retries"] == 3  # Default from BaseConfigManager
 
-@patch.dict(os.environ, {"TESTSERVICE_API_KEY": "env_key"}, clear=True)
 @patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
-def test_get_credential_from_env_service_specific(mock_find_dir):
-    TestConfigManager = create_test_config_manager_class()
-    manager = TestConfigManager()
+def test_get_credential_from_env_service_specific(mock_find_dir, config_manager_cls, monkeypatch):
+    monkeypatch.setenv("TESTSERVICE_API_KEY", "env_key")
+    manager = config_manager_cls()
     assert manager.get_credential_from_env("API_KEY") == "env_key"
 
-@patch.dict(os.environ, {"API_KEY": "generic_key"}, clear=True)
 @patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
-def test_get_credential_from_env_generic(mock_find_dir):
-    TestConfigManager = create_test_config_manager_class()
-    manager = TestConfigManager()
+def test_get_credential_from_env_generic(mock_find_dir, config_manager_cls, monkeypatch):
+    monkeypatch.delenv("TESTSERVICE_API_KEY", raising=False)
+    monkeypatch.setenv("API_KEY", "generic_key")
+    manager = config_manager_cls()
     assert manager.get_credential_from_env("API_KEY") == "generic_key"
 
-@patch.dict(os.environ, {"TESTSERVICE_API_KEY": "service_key", "API_KEY": "generic_key_should_not_be_used"}, clear=True)
 @patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
-def test_get_credential_from_env_priority(mock_find_dir):
-    TestConfigManager = create_test_config_manager_class()
-    manager = TestConfigManager()
+def test_get_credential_from_env_priority(mock_find_dir, config_manager_cls, monkeypatch):
+    monkeypatch.setenv("TESTSERVICE_API_KEY", "service_key")
+    monkeypatch.setenv("API_KEY", "generic_key_should_not_be_used")
+    manager = config_manager_cls()
     assert manager.get_credential_from_env("API_KEY") == "service_key"
 
 @patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
-def test_get_instance(mock_find_dir):
-    TestConfigManager = create_test_config_manager_class()
-    instance = TestConfigManager.get_instance()
-    assert isinstance(instance, TestConfigManager)
+def test_get_instance(mock_find_dir, config_manager_cls):
+    instance = config_manager_cls.get_instance()
+    assert isinstance(instance, config_manager_cls)
     assert instance.service_name == "testservice"
+
+@patch('assistant_skills_lib.config_manager.BaseConfigManager._find_claude_dir', return_value=None)
+def test_get_instance_reuses_and_resets(mock_find_dir, config_manager_cls):
+    instance = config_manager_cls.get_instance()
+    with patch.object(config_manager_cls, '_load_config') as mock_load:
+        assert config_manager_cls.get_instance() is instance
+    mock_load.assert_not_called()
+    config_manager_cls.reset_instance()
+    assert config_manager_cls.get_instance() is not instance
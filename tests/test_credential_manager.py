@@ -7,11 +7,11 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import patch, MagicMock
 
+from assistant_skills_lib import config_manager, credential_manager
 from assistant_skills_lib.credential_manager import (
     BaseCredentialManager,
     CredentialBackend,
     CredentialNotFoundError,
-    KEYRING_AVAILABLE,
 )
 
 
@@ -61,36 +61,41 @@ class TestCredentialNotFoundError:
 class TestIsKeychainAvailable:
     """Tests for is_keychain_available static method."""
 
-    def test_returns_false_when_keyring_not_installed(self):
+    @pytest.fixture(autouse=True)
+    def reset_probe(self):
+        """Clear the memoized keyring probe around each test."""
+        credential_manager._keychain_probe.cache_clear()
+        yield
+        credential_manager._keychain_probe.cache_clear()
+
+    def test_returns_false_when_keyring_not_installed(self, monkeypatch):
         """Test returns False when keyring not available."""
-        with patch(
-            "assistant_skills_lib.credential_manager.KEYRING_AVAILABLE", False
-        ):
-            assert BaseCredentialManager.is_keychain_available() is False
+        monkeypatch.setattr(credential_manager, "KEYRING_AVAILABLE", False)
+        assert BaseCredentialManager.is_keychain_available() is False
 
-    def test_returns_true_when_keyring_works(self):
+    def test_returns_true_when_keyring_works(self, monkeypatch):
         """Test returns True when keyring is functional."""
-        if not KEYRING_AVAILABLE:
-            pytest.skip("keyring not installed")
-
-        with patch("assistant_skills_lib.credential_manager.keyring") as mock_keyring:
-            mock_keyring.get_keyring.return_value = MagicMock()
-            with patch(
-                "assistant_skills_lib.credential_manager.KEYRING_AVAILABLE", True
-            ):
-                assert BaseCredentialManager.is_keychain_available() is True
+        fake_keyring = MagicMock()
+        monkeypatch.setattr(credential_manager, "keyring", fake_keyring, raising=False)
+        monkeypatch.setattr(credential_manager, "KEYRING_AVAILABLE", True)
+        assert BaseCredentialManager.is_keychain_available() is True
 
-    def test_returns_false_when_keyring_raises(self):
+    def test_returns_false_when_keyring_raises(self, monkeypatch):
         """Test returns False when keyring raises exception."""
-        if not KEYRING_AVAILABLE:
-            pytest.skip("keyring not installed")
-
-        with patch("assistant_skills_lib.credential_manager.keyring") as mock_keyring:
-            mock_keyring.get_keyring.side_effect = Exception("Keyring error")
-            with patch(
-                "assistant_skills_lib.credential_manager.KEYRING_AVAILABLE", True
-            ):
-                assert BaseCredentialManager.is_keychain_available() is False
+        fake_keyring = MagicMock()
+        fake_keyring.get_keyring.side_effect = Exception("Keyring error")
+        monkeypatch.setattr(credential_manager, "keyring", fake_keyring, raising=False)
+        monkeypatch.setattr(credential_manager, "KEYRING_AVAILABLE", True)
+        assert BaseCredentialManager.is_keychain_available() is False
+
+    def test_probe_runs_once(self, monkeypatch):
+        """Test the keyring backend is probed once per process."""
+        fake_keyring = MagicMock()
+        monkeypatch.setattr(credential_manager, "keyring", fake_keyring, raising=False)
+        monkeypatch.setattr(credential_manager, "KEYRING_AVAILABLE", True)
+        assert BaseCredentialManager.is_keychain_available() is True
+        assert BaseCredentialManager.is_keychain_available() is True
+        fake_keyring.get_keyring.assert_called_once_with()
 
 
 class TestFindClaudeDir:
@@ -129,14 +134,66 @@ class TestFindClaudeDir:
 
         assert mgr._claude_dir is None
 
+    def test_lookup_shared_across_instances(self, tmp_path, monkeypatch):
+        """Test repeated construction reuses the memoized walk."""
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        walks = []
+        resolve = config_manager._resolve_claude_dir
+        monkeypatch.setattr(
+            config_manager, "_resolve_claude_dir",
+            lambda *args: walks.append(args) or resolve(*args),
+        )
+
+        ConcreteCredentialManager()
+        mgr = ConcreteCredentialManager()
+
+        assert mgr._claude_dir == claude_dir
+        assert len(walks) == 1
+
+    def test_claude_dir_created_after_miss(self, tmp_path, monkeypatch):
+        """Test a .claude created after a failed lookup is used for storage."""
+        monkeypatch.chdir(tmp_path)
+        assert ConcreteCredentialManager()._claude_dir is None
+
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        mgr = ConcreteCredentialManager()
+        stored = {"api_url": "https://example.com", "username": "user", "api_token": "token"}
+
+        assert mgr._claude_dir == claude_dir
+        assert mgr.store_credentials(stored, backend=CredentialBackend.JSON_FILE) == CredentialBackend.JSON_FILE
+        assert mgr.get_credentials_from_json() == stored
+
+
+@pytest.fixture
+def claude_dir(tmp_path):
+    """Empty .claude directory under tmp_path."""
+    claude_dir = tmp_path / ".claude"
+    claude_dir.mkdir()
+    return claude_dir
+
+
+@pytest.fixture
+def mgr(request, tmp_path, monkeypatch):
+    """Manager constructed with tmp_path as the working directory.
+
+    Tests that also request ``claude_dir`` get the directory created before
+    construction, so the manager resolves it.
+    """
+    if "claude_dir" in request.fixturenames:
+        request.getfixturevalue("claude_dir")
+    monkeypatch.chdir(tmp_path)
+    return ConcreteCredentialManager()
+
 
 class TestGetCredentialNotFoundHint:
     """Tests for get_credential_not_found_hint method."""
 
-    def test_includes_env_vars(self, tmp_path, monkeypatch):
+    def test_includes_env_vars(self, mgr):
         """Test hint includes environment variable instructions."""
-        monkeypatch.chdir(tmp_path)
-        mgr = ConcreteCredentialManager()
         hint = mgr.get_credential_not_found_hint()
 
         assert "TEST_API_URL" in hint
@@ -144,10 +201,8 @@ class TestGetCredentialNotFoundHint:
         assert "TEST_API_TOKEN" in hint
         assert "export" in hint
 
-    def test_format_structure(self, tmp_path, monkeypatch):
+    def test_format_structure(self, mgr):
         """Test hint has proper structure."""
-        monkeypatch.chdir(tmp_path)
-        mgr = ConcreteCredentialManager()
         hint = mgr.get_credential_not_found_hint()
 
         # Should have one line per field
@@ -155,60 +210,74 @@ class TestGetCredentialNotFoundHint:
         assert len(lines) >= 3  # Header + 3 fields
 
 
+    def test_exact_text_built_once(self, mgr):
+        """Test hint text is unchanged and reused across calls."""
+        hint = mgr.get_credential_not_found_hint()
+
+        assert hint == (
+            "Set environment variables:\n"
+            "  export TEST_API_URL='your-api-url'\n"
+            "  export TEST_USERNAME='your-username'\n"
+            "  export TEST_API_TOKEN='your-api-token'\n"
+        )
+        assert mgr.get_credential_not_found_hint() is hint
+
+
 class TestGetCredentialsFromEnv:
     """Tests for get_credentials_from_env method."""
 
-    def test_gets_env_vars(self, tmp_path, monkeypatch):
+    def test_gets_env_vars(self, mgr, monkeypatch):
         """Test getting credentials from environment."""
-        monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("TEST_API_URL", "https://example.com")
         monkeypatch.setenv("TEST_USERNAME", "testuser")
         monkeypatch.setenv("TEST_API_TOKEN", "secret123")
 
-        mgr = ConcreteCredentialManager()
         creds = mgr.get_credentials_from_env()
 
         assert creds["api_url"] == "https://example.com"
         assert creds["username"] == "testuser"
         assert creds["api_token"] == "secret123"
 
-    def test_returns_none_for_missing(self, tmp_path, monkeypatch):
+    def test_returns_none_for_missing(self, mgr, monkeypatch):
         """Test returns None for missing env vars."""
-        monkeypatch.chdir(tmp_path)
         # Ensure env vars are not set
         monkeypatch.delenv("TEST_API_URL", raising=False)
         monkeypatch.delenv("TEST_USERNAME", raising=False)
         monkeypatch.delenv("TEST_API_TOKEN", raising=False)
 
-        mgr = ConcreteCredentialManager()
         creds = mgr.get_credentials_from_env()
 
         assert creds["api_url"] is None
         assert creds["username"] is None
         assert creds["api_token"] is None
 
-    def test_partial_env_vars(self, tmp_path, monkeypatch):
+    def test_partial_env_vars(self, mgr, monkeypatch):
         """Test with some env vars set, some missing."""
-        monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("TEST_API_URL", "https://example.com")
         monkeypatch.delenv("TEST_USERNAME", raising=False)
         monkeypatch.delenv("TEST_API_TOKEN", raising=False)
 
-        mgr = ConcreteCredentialManager()
         creds = mgr.get_credentials_from_env()
 
         assert creds["api_url"] == "https://example.com"
         assert creds["username"] is None
         assert creds["api_token"] is None
 
+    def test_sees_env_changes_after_init(self, mgr, monkeypatch):
+        """Test env var names are precomputed but values are read per call."""
+        monkeypatch.delenv("TEST_USERNAME", raising=False)
+
+        assert mgr.get_credentials_from_env()["username"] is None
+
+        monkeypatch.setenv("TEST_USERNAME", "lateuser")
+        assert mgr.get_credentials_from_env()["username"] == "lateuser"
+
 
 class TestGetCredentialsFromJson:
     """Tests for get_credentials_from_json method."""
 
-    def test_reads_from_settings_local(self, tmp_path, monkeypatch):
+    def test_reads_from_settings_local(self, claude_dir, mgr):
         """Test reading credentials from settings.local.json."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
         settings_file = claude_dir / "settings.local.json"
         settings_file.write_text(
             json.dumps(
@@ -223,9 +292,7 @@ class TestGetCredentialsFromJson:
                 }
             )
         )
-        monkeypatch.chdir(tmp_path)
 
-        mgr = ConcreteCredentialManager()
         creds = mgr.get_credentials_from_json()
 
         assert creds["api_url"] == "https://json.example.com"
@@ -243,39 +310,26 @@ class TestGetCredentialsFromJson:
 
         assert all(v is None for v in creds.values())
 
-    def test_returns_none_when_file_missing(self, tmp_path, monkeypatch):
+    def test_returns_none_when_file_missing(self, claude_dir, mgr):
         """Test returns None when settings.local.json missing."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        monkeypatch.chdir(tmp_path)
-
-        mgr = ConcreteCredentialManager()
         creds = mgr.get_credentials_from_json()
 
         assert all(v is None for v in creds.values())
 
-    def test_returns_none_for_invalid_json(self, tmp_path, monkeypatch):
+    def test_returns_none_for_invalid_json(self, claude_dir, mgr):
         """Test returns None for invalid JSON."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
         settings_file = claude_dir / "settings.local.json"
         settings_file.write_text("invalid json {{{")
-        monkeypatch.chdir(tmp_path)
 
-        mgr = ConcreteCredentialManager()
         creds = mgr.get_credentials_from_json()
 
         assert all(v is None for v in creds.values())
 
-    def test_returns_none_for_missing_section(self, tmp_path, monkeypatch):
+    def test_returns_none_for_missing_section(self, claude_dir, mgr):
         """Test returns None when service section missing."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
         settings_file = claude_dir / "settings.local.json"
         settings_file.write_text(json.dumps({"other_service": {}}))
-        monkeypatch.chdir(tmp_path)
 
-        mgr = ConcreteCredentialManager()
         creds = mgr.get_credentials_from_json()
 
         assert all(v is None for v in creds.values())
@@ -284,11 +338,9 @@ class TestGetCredentialsFromJson:
 class TestGetCredentials:
     """Tests for get_credentials method."""
 
-    def test_prefers_env_over_json(self, tmp_path, monkeypatch):
+    def test_prefers_env_over_json(self, claude_dir, mgr, monkeypatch):
         """Test environment variables take priority over JSON."""
         # Setup JSON
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
         settings_file = claude_dir / "settings.local.json"
         settings_file.write_text(
             json.dumps(
@@ -303,14 +355,12 @@ class TestGetCredentials:
                 }
             )
         )
-        monkeypatch.chdir(tmp_path)
 
         # Setup env (overrides JSON)
         monkeypatch.setenv("TEST_API_URL", "https://env.example.com")
         monkeypatch.setenv("TEST_USERNAME", "envuser")
         monkeypatch.setenv("TEST_API_TOKEN", "envsecret")
 
-        mgr = ConcreteCredentialManager()
         # Disable keychain to avoid interference
         with patch.object(mgr, "is_keychain_available", return_value=False):
             creds = mgr.get_credentials()
@@ -319,26 +369,22 @@ class TestGetCredentials:
         assert creds["username"] == "envuser"
         assert creds["api_token"] == "envsecret"
 
-    def test_raises_when_missing(self, tmp_path, monkeypatch):
+    def test_raises_when_missing(self, mgr, monkeypatch):
         """Test raises CredentialNotFoundError when credentials missing."""
-        monkeypatch.chdir(tmp_path)
         # Ensure env vars are not set
         monkeypatch.delenv("TEST_API_URL", raising=False)
         monkeypatch.delenv("TEST_USERNAME", raising=False)
         monkeypatch.delenv("TEST_API_TOKEN", raising=False)
 
-        mgr = ConcreteCredentialManager()
         with patch.object(mgr, "is_keychain_available", return_value=False):
             with pytest.raises(CredentialNotFoundError) as exc_info:
                 mgr.get_credentials()
 
         assert "test-assistant" in str(exc_info.value)
 
-    def test_merges_sources(self, tmp_path, monkeypatch):
+    def test_merges_sources(self, claude_dir, mgr, monkeypatch):
         """Test merges credentials from multiple sources."""
         # Setup JSON with partial credentials
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
         settings_file = claude_dir / "settings.local.json"
         settings_file.write_text(
             json.dumps(
@@ -353,14 +399,12 @@ class TestGetCredentials:
                 }
             )
         )
-        monkeypatch.chdir(tmp_path)
 
         # Only set one env var
         monkeypatch.setenv("TEST_API_TOKEN", "env_override_token")
         monkeypatch.delenv("TEST_API_URL", raising=False)
         monkeypatch.delenv("TEST_USERNAME", raising=False)
 
-        mgr = ConcreteCredentialManager()
         with patch.object(mgr, "is_keychain_available", return_value=False):
             creds = mgr.get_credentials()
 
@@ -370,16 +414,53 @@ class TestGetCredentials:
         assert creds["api_token"] == "env_override_token"
 
 
+    def test_subclass_metadata_resolved_once(self, tmp_path, monkeypatch):
+        """Test fields and env prefix are read once, on first use."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("TEST_API_URL", "https://env.example.com")
+        monkeypatch.setenv("TEST_USERNAME", "envuser")
+        monkeypatch.setenv("TEST_API_TOKEN", "envsecret")
+        calls = []
+
+        class CountingManager(ConcreteCredentialManager):
+            def get_credential_fields(self) -> list[str]:
+                calls.append("fields")
+                return super().get_credential_fields()
+
+            def get_env_prefix(self) -> str:
+                calls.append("prefix")
+                return super().get_env_prefix()
+
+        mgr = CountingManager()
+        mgr.get_credentials()
+        mgr.get_credentials()
+
+        assert sorted(calls) == ["fields", "prefix"]
+
+    def test_hooks_may_use_attributes_set_after_init(self, tmp_path, monkeypatch):
+        """Test subclass hooks can depend on state assigned after super().__init__()."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("PROD_API_URL", "https://env.example.com")
+
+        class ConfiguredManager(ConcreteCredentialManager):
+            def __init__(self, prefix):
+                super().__init__()
+                self.prefix = prefix
+
+            def get_env_prefix(self) -> str:
+                return self.prefix
+
+        mgr = ConfiguredManager("PROD")
+
+        assert mgr.get_credentials_from_env()["api_url"] == "https://env.example.com"
+        assert "PROD_API_URL" in mgr.get_credential_not_found_hint()
+
+
 class TestStoreCredentials:
     """Tests for store_credentials method."""
 
-    def test_stores_to_json_file(self, tmp_path, monkeypatch):
+    def test_stores_to_json_file(self, claude_dir, mgr):
         """Test storing credentials to JSON file."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        monkeypatch.chdir(tmp_path)
-
-        mgr = ConcreteCredentialManager()
         with patch.object(mgr, "is_keychain_available", return_value=False):
             backend = mgr.store_credentials(
                 {
@@ -400,15 +481,49 @@ class TestStoreCredentials:
             config = json.load(f)
         assert config["test"]["credentials"]["api_url"] == "https://store.example.com"
 
-    def test_validates_empty_fields(self, tmp_path, monkeypatch):
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_stored_file_is_owner_only(self, claude_dir, mgr):
+        """Test settings.local.json is created with 0600 permissions."""
+        mgr.store_credentials(
+            {"api_url": "https://example.com", "username": "u", "api_token": "t"},
+            backend=CredentialBackend.JSON_FILE,
+        )
+
+        mode = (claude_dir / "settings.local.json").stat().st_mode & 0o777
+        assert mode == 0o600
+
+    def test_store_replaces_cached_settings(self, claude_dir, mgr):
+        """Test stored credentials are read back even if the old file was cached."""
+        settings_file = claude_dir / "settings.local.json"
+        settings_file.write_text('{"test": {"credentials": {"username": "old"}}}')
+        os.utime(settings_file, ns=(0, 0))
+        assert mgr.get_credentials_from_json()["username"] == "old"
+        stored = {
+            "api_url": "https://store.example.com",
+            "username": "storeuser",
+            "api_token": "storesecret",
+        }
+
+        mgr.store_credentials(stored, backend=CredentialBackend.JSON_FILE)
+
+        assert mgr.get_credentials_from_json() == stored
+
+    def test_store_keeps_existing_non_finite_values(self, claude_dir, mgr):
+        """Test storing into a file json accepts (NaN) works and keeps the value."""
+        settings_file = claude_dir / "settings.local.json"
+        settings_file.write_text('{"other": {"ratio": NaN}}')
+
+        mgr.store_credentials(
+            {"api_url": "https://example.com", "username": "u", "api_token": "t"},
+            backend=CredentialBackend.JSON_FILE,
+        )
+
+        assert '"ratio": NaN' in settings_file.read_text()
+
+    def test_validates_empty_fields(self, claude_dir, mgr):
         """Test raises ValidationError for empty fields."""
         from assistant_skills_lib.error_handler import ValidationError
 
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        monkeypatch.chdir(tmp_path)
-
-        mgr = ConcreteCredentialManager()
         with pytest.raises(ValidationError):
             mgr.store_credentials(
                 {
@@ -419,13 +534,25 @@ class TestStoreCredentials:
             )
 
 
+    def test_reports_all_empty_fields(self, claude_dir, mgr):
+        """Test ValidationError lists every empty or blank field."""
+        from assistant_skills_lib.error_handler import ValidationError
+
+        with pytest.raises(ValidationError) as exc_info:
+            mgr.store_credentials({"api_url": "https://example.com", "username": "  "})
+
+        assert exc_info.value.message == "username, api_token cannot be empty"
+        assert exc_info.value.details == {
+            "field": "username",
+            "fields": ["username", "api_token"],
+        }
+
+
 class TestDeleteCredentials:
     """Tests for delete_credentials method."""
 
-    def test_deletes_from_json(self, tmp_path, monkeypatch):
+    def test_deletes_from_json(self, claude_dir, mgr):
         """Test deleting credentials from JSON file."""
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
         settings_file = claude_dir / "settings.local.json"
         settings_file.write_text(
             json.dumps(
@@ -440,9 +567,7 @@ class TestDeleteCredentials:
                 }
             )
         )
-        monkeypatch.chdir(tmp_path)
 
-        mgr = ConcreteCredentialManager()
         with patch.object(mgr, "is_keychain_available", return_value=False):
             result = mgr.delete_credentials()
 
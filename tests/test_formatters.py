@@ -5,12 +5,10 @@ Tests for the formatters module which provides output formatting utilities.
 """
 
 import pytest
+import json
 import sys
-import csv
 from io import StringIO
 from pathlib import Path
-from unittest.mock import patch
-from tempfile import TemporaryDirectory
 
 from assistant_skills_lib.formatters import (
     # Sensitive field detection
@@ -60,31 +58,35 @@ from assistant_skills_lib.formatters import (
 class TestSensitiveFieldDetection:
     """Tests for sensitive field detection and redaction."""
 
-    def test_is_sensitive_field_with_known_patterns(self):
+    @pytest.mark.parametrize("name", [
+        "password", "PASSWORD", "user_password",
+        "api_key", "apikey", "API_KEY",
+        "token", "access_token", "refresh_token",
+        "secret", "client_secret",
+        "authorization", "auth_header",
+        "credential", "credentials",
+        "private_key", "privatekey",
+        "session_key", "sessionkey",
+        "bearer",
+    ])
+    def test_is_sensitive_field_with_known_patterns(self, name):
         """Known sensitive patterns should be detected."""
-        sensitive_names = [
-            "password", "PASSWORD", "user_password",
-            "api_key", "apikey", "API_KEY",
-            "token", "access_token", "refresh_token",
-            "secret", "client_secret",
-            "authorization", "auth_header",
-            "credential", "credentials",
-            "private_key", "privatekey",
-            "session_key", "sessionkey",
-            "bearer",
-        ]
-        for name in sensitive_names:
-            assert is_sensitive_field(name), f"{name} should be detected as sensitive"
-
-    def test_is_sensitive_field_with_safe_patterns(self):
+        assert is_sensitive_field(name)
+
+    @pytest.mark.parametrize("pattern", sorted(SENSITIVE_FIELD_PATTERNS))
+    def test_every_pattern_is_detected_in_any_case(self, pattern):
+        """Each declared pattern should match, even ones folded into a shorter one."""
+        assert is_sensitive_field(pattern)
+        assert is_sensitive_field(f"X_{pattern.upper()}_Y")
+
+    @pytest.mark.parametrize("name", [
+        "username", "email", "name", "id",
+        "created_at", "updated_at",
+        "count", "total", "status",
+    ])
+    def test_is_sensitive_field_with_safe_patterns(self, name):
         """Non-sensitive fields should not be flagged."""
-        safe_names = [
-            "username", "email", "name", "id",
-            "created_at", "updated_at",
-            "count", "total", "status",
-        ]
-        for name in safe_names:
-            assert not is_sensitive_field(name), f"{name} should not be flagged"
+        assert not is_sensitive_field(name)
 
     def test_redact_sensitive_value(self):
         """Sensitive values should be redacted."""
@@ -112,6 +114,15 @@ class TestSensitiveFieldDetection:
 # Table Formatting Tests
 # =============================================================================
 
+@pytest.fixture(scope="module")
+def people():
+    """Rows shared by the table tests; treat as read-only."""
+    return (
+        {"name": "Alice", "age": 30, "city": "NYC"},
+        {"name": "Bob", "age": 25, "city": "LA"},
+    )
+
+
 class TestFormatTable:
     """Tests for table formatting."""
 
@@ -119,30 +130,27 @@ class TestFormatTable:
         """Empty data should return '(no data)'."""
         assert format_table([]) == "(no data)"
 
-    def test_format_table_basic(self):
+    def test_format_table_basic(self, people):
         """Basic table formatting should work."""
-        data = [
-            {"name": "Alice", "age": 30},
-            {"name": "Bob", "age": 25},
-        ]
-        result = format_table(data)
+        result = format_table(people)
         assert "Alice" in result
         assert "Bob" in result
         assert "30" in result
         assert "25" in result
 
-    def test_format_table_with_columns(self):
+    def test_format_table_with_columns(self, people):
         """Specifying columns should filter output."""
-        data = [
-            {"name": "Alice", "age": 30, "city": "NYC"},
-            {"name": "Bob", "age": 25, "city": "LA"},
-        ]
-        result = format_table(data, columns=["name", "city"])
+        result = format_table(people, columns=["name", "city"])
         assert "Alice" in result
         assert "NYC" in result
         # age column should not appear
         assert "30" not in result or "age" not in result.lower()
 
+    def test_format_table_missing_keys(self, people):
+        """Rows missing a column should render an empty cell."""
+        result = format_table([*people, {"name": "Carol"}], columns=["name", "city"])
+        assert result.splitlines()[-1].split() == ["Carol"]
+
     def test_format_table_with_custom_headers(self):
         """Custom headers should be used."""
         data = [{"name": "Alice"}]
@@ -161,6 +169,13 @@ class TestFormatTable:
         result = format_table(data, columns=["user"])
         assert "John" in result
 
+    def test_format_table_with_titled_and_plain_dicts(self):
+        """Dicts without a name fall back to title, then to str()."""
+        data = [{"page": {"title": "Home"}}, {"page": {"id": 7}}]
+        result = format_table(data, columns=["page"])
+        assert "Home" in result
+        assert "{'id': 7}" in result
+
 
 class TestBasicTableFallback:
     """Tests for the fallback table formatter when tabulate is not available."""
@@ -195,6 +210,24 @@ class TestBasicTableFallback:
         data_row = lines[2].strip()  # Third line is the data
         assert len(data_row) <= 20, f"Data row too long: {len(data_row)}"
 
+    def test_fallback_layout(self):
+        """Columns should be as wide as their widest cell, capped at max_col_width."""
+        data = [{"id": 1, "name": "Alice"}, {"id": 22, "name": "x" * 12}, {"id": 333}]
+        result = _format_basic_table_fallback(
+            data,
+            columns=["id", "name"],
+            headers=["ID", "Name"],
+            max_col_width=8,
+            truncate_long_values=True,
+        )
+        assert result.split("\n") == [
+            "ID  | Name    ",
+            "----+---------",
+            "1   | Alice   ",
+            "22  | xxxxxxxx",
+            "333 |         ",
+        ]
+
 
 # =============================================================================
 # Tree Formatting Tests
@@ -245,6 +278,31 @@ class TestFormatTree:
         assert "folder" in result
         assert "file1" in result
 
+    def test_format_tree_exact_output(self):
+        """Children are drawn under their parent, before later siblings."""
+        items = [
+            {"name": "a", "children": [{"name": "a1"}, {"name": "a2", "children": ["x"]}]},
+            {"name": "b"},
+        ]
+        assert format_tree("Root", items) == "\n".join([
+            "Root",
+            "├── a",
+            "│   ├── a1",
+            "│   └── a2",
+            "│       └── x",
+            "└── b",
+        ])
+
+    def test_format_tree_deeper_than_recursion_limit(self):
+        """Very deep trees render without recursion errors."""
+        depth = sys.getrecursionlimit() + 100
+        node = {"name": "leaf"}
+        for i in range(depth):
+            node = {"name": f"n{i}", "children": [node]}
+        lines = format_tree("Root", [node]).splitlines()
+        assert len(lines) == depth + 2
+        assert lines[-1].endswith("└── leaf")
+
 
 # =============================================================================
 # JSON Formatting Tests
@@ -280,6 +338,25 @@ class TestFormatJson:
         result = format_json(data)
         assert "2024-01-01" in result
 
+    def test_format_json_matches_json_dumps(self):
+        """Output is exactly json.dumps(default=str), including awkward values."""
+        import enum
+        from datetime import datetime
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        data = {
+            "name": "中文", "count": 2, "ratio": 0.5, "none": None, "flag": True,
+            "items": [1, [], {}], 7: "int key", "when": datetime(2024, 1, 1, 12),
+            "tags": {"a"}, "huge": 2 ** 70,
+            "nan": float("nan"), "inf": float("inf"), "big": 1e100, "small": 1e-7,
+            "color": Color.RED,
+        }
+        expected = json.dumps(data, indent=2, default=str, ensure_ascii=False)
+        assert format_json(data) == expected
+        assert '"nan": NaN' in expected and '"big": 1e+100' in expected
+
 
 # =============================================================================
 # List Formatting Tests
@@ -313,6 +390,11 @@ class TestFormatList:
         assert "c" in result
         assert "2 more" in result
 
+    def test_format_list_exact_output(self):
+        """Lines should be joined with newlines and no trailing newline."""
+        assert format_list(["a", "b"], bullet="-") == " - a\n - b"
+        assert format_list(["x", "y", "z"], numbered=True, max_items=2) == " 1. x\n 2. y\n ... and 1 more"
+
 
 # =============================================================================
 # Color Utilities Tests
@@ -327,23 +409,35 @@ class TestColorUtilities:
         assert Colors.GREEN.startswith("\033[")
         assert Colors.RESET == "\033[0m"
 
-    def test_supports_color_non_tty(self):
+    def test_supports_color_non_tty(self, monkeypatch):
         """Non-TTY should not support color."""
-        with patch.object(sys.stdout, "isatty", return_value=False):
-            assert not _supports_color()
+        monkeypatch.setattr(sys, "stdout", StringIO())
+        assert not _supports_color()
+
+    def test_supports_color_rechecks_replaced_stdout(self, monkeypatch):
+        """The cached answer should follow sys.stdout when it is swapped."""
+
+        class FakeTTY(StringIO):
+            def isatty(self):
+                return True
 
-    def test_colorize_with_color_support(self):
+        monkeypatch.setattr(sys, "stdout", FakeTTY())
+        assert _supports_color()
+        monkeypatch.setattr(sys, "stdout", StringIO())
+        assert not _supports_color()
+
+    def test_colorize_with_color_support(self, monkeypatch):
         """Colorize should add codes when supported."""
-        with patch("assistant_skills_lib.formatters._supports_color", return_value=True):
-            result = _colorize("test", Colors.RED)
-            assert Colors.RED in result
-            assert Colors.RESET in result
+        monkeypatch.setattr("assistant_skills_lib.formatters._supports_color", lambda: True)
+        result = _colorize("test", Colors.RED)
+        assert Colors.RED in result
+        assert Colors.RESET in result
 
-    def test_colorize_without_color_support(self):
+    def test_colorize_without_color_support(self, monkeypatch):
         """Colorize should return plain text when not supported."""
-        with patch("assistant_skills_lib.formatters._supports_color", return_value=False):
-            result = _colorize("test", Colors.RED)
-            assert result == "test"
+        monkeypatch.setattr("assistant_skills_lib.formatters._supports_color", lambda: False)
+        result = _colorize("test", Colors.RED)
+        assert result == "test"
 
 
 # =============================================================================
@@ -353,42 +447,41 @@ class TestColorUtilities:
 class TestPrintFunctions:
     """Tests for print functions."""
 
+    @pytest.fixture(autouse=True)
+    def _no_color(self, monkeypatch):
+        monkeypatch.setattr("assistant_skills_lib.formatters._supports_color", lambda: False)
+
     def test_print_success(self, capsys):
         """print_success should print with checkmark."""
-        with patch("assistant_skills_lib.formatters._supports_color", return_value=False):
-            print_success("done")
+        print_success("done")
         captured = capsys.readouterr()
         assert "✓" in captured.out
         assert "done" in captured.out
 
     def test_print_error(self, capsys):
         """print_error should print to stderr."""
-        with patch("assistant_skills_lib.formatters._supports_color", return_value=False):
-            print_error("failed")
+        print_error("failed")
         captured = capsys.readouterr()
         assert "✗" in captured.err
         assert "failed" in captured.err
 
     def test_print_warning(self, capsys):
         """print_warning should print with warning marker."""
-        with patch("assistant_skills_lib.formatters._supports_color", return_value=False):
-            print_warning("caution")
+        print_warning("caution")
         captured = capsys.readouterr()
         assert "!" in captured.out
         assert "caution" in captured.out
 
     def test_print_info(self, capsys):
         """print_info should print with info marker."""
-        with patch("assistant_skills_lib.formatters._supports_color", return_value=False):
-            print_info("note")
+        print_info("note")
         captured = capsys.readouterr()
         assert "→" in captured.out
         assert "note" in captured.out
 
     def test_print_header(self, capsys):
         """print_header should print title with underline."""
-        with patch("assistant_skills_lib.formatters._supports_color", return_value=False):
-            print_header("Section")
+        print_header("Section")
         captured = capsys.readouterr()
         assert "Section" in captured.out
         assert "=======" in captured.out
@@ -532,35 +625,33 @@ class TestFormatTimestamp:
 class TestExportCsv:
     """Tests for CSV export."""
 
-    def test_export_csv_basic(self):
+    def test_export_csv_basic(self, tmp_path):
         """Basic CSV export should work."""
-        with TemporaryDirectory() as tmpdir:
-            data = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
-            path = Path(tmpdir) / "test.csv"
-            result = export_csv(data, path)
+        data = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
+        path = tmp_path / "test.csv"
+        result = export_csv(data, path)
 
-            assert result.exists()
-            content = result.read_text()
-            assert "name,age" in content
-            assert "Alice,30" in content
+        assert result.exists()
+        content = result.read_text()
+        assert "name,age" in content
+        assert "Alice,30" in content
 
-    def test_export_csv_empty_raises(self):
+    def test_export_csv_empty_raises(self, tmp_path):
         """Empty data should raise ValueError."""
-        with TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "test.csv"
-            with pytest.raises(ValueError, match="No data"):
-                export_csv([], path)
+        path = tmp_path / "test.csv"
+        with pytest.raises(ValueError, match="No data"):
+            export_csv([], path)
+        assert not path.exists()
 
-    def test_export_csv_custom_columns(self):
+    def test_export_csv_custom_columns(self, tmp_path):
         """Custom columns should filter output."""
-        with TemporaryDirectory() as tmpdir:
-            data = [{"a": 1, "b": 2, "c": 3}]
-            path = Path(tmpdir) / "test.csv"
-            export_csv(data, path, columns=["a", "c"])
-
-            content = path.read_text()
-            assert "a,c" in content
-            assert "b" not in content
+        data = [{"a": 1, "b": 2, "c": 3}]
+        path = tmp_path / "test.csv"
+        export_csv(data, path, columns=["a", "c"])
+
+        content = path.read_text()
+        assert "a,c" in content
+        assert "b" not in content
 
 
 class TestGetCsvString:
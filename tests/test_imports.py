@@ -1,117 +1,77 @@
 """Tests to verify all imports work correctly."""
 
+import importlib
+
 import pytest
 
+import assistant_skills_lib
+
+
+def _is_exception(obj):
+    return isinstance(obj, type) and issubclass(obj, Exception)
+
+
+def _is_api_error(obj):
+    return _is_exception(obj) and issubclass(obj, assistant_skills_lib.APIError)
+
+
+# Public names re-exported from the package, with the check each must pass.
+EXPORTS = {
+    # formatters
+    "format_table": callable,
+    "format_tree": callable,
+    "format_list": callable,
+    "format_json": callable,
+    "Colors": lambda obj: obj is not None,
+    # validators
+    "validate_url": callable,
+    "validate_required": callable,
+    "validate_name": callable,
+    "InputValidationError": _is_exception,
+    # cache
+    "Cache": lambda obj: obj is not None,
+    "cached": callable,
+    "get_cache": callable,
+    "invalidate": callable,
+    # error_handler
+    "APIError": _is_exception,
+    "AuthenticationError": _is_api_error,
+    "NotFoundError": _is_api_error,
+    "RateLimitError": _is_api_error,
+    "handle_errors": callable,
+    "print_error": callable,
+    "ErrorContext": lambda obj: obj is not None,
+    # template_engine
+    "load_template": callable,
+    "render_template": callable,
+    "list_placeholders": callable,
+    # project_detector
+    "detect_project": callable,
+    "list_skills": callable,
+    "validate_structure": callable,
+    "get_project_stats": callable,
+}
+
 
 def test_version():
     """Test that version is accessible."""
-    from assistant_skills_lib import __version__
-    assert __version__ is not None
-    assert isinstance(__version__, str)
-
-
-def test_formatter_imports():
-    """Test formatter module imports."""
-    from assistant_skills_lib import (
-        format_table,
-        format_tree,
-        format_list,
-        format_json,
-        Colors,
-    )
-    assert callable(format_table)
-    assert callable(format_tree)
-    assert callable(format_list)
-    assert callable(format_json)
-    assert Colors is not None
-
-
-def test_validator_imports():
-    """Test validator module imports."""
-    from assistant_skills_lib import (
-        validate_url,
-        validate_required,
-        validate_name,
-        InputValidationError,
-    )
-    assert callable(validate_url)
-    assert callable(validate_required)
-    assert callable(validate_name)
-    assert issubclass(InputValidationError, Exception)
-
+    assert isinstance(assistant_skills_lib.__version__, str)
 
-def test_cache_imports():
-    """Test cache module imports."""
-    from assistant_skills_lib import (
-        Cache,
-        cached,
-        get_cache,
-        invalidate,
-    )
-    assert Cache is not None
-    assert callable(cached)
-    assert callable(get_cache)
-    assert callable(invalidate)
 
+@pytest.mark.parametrize("name, check", EXPORTS.items(), ids=list(EXPORTS))
+def test_package_exports(name, check):
+    """Test each public name is importable from the package."""
+    assert check(getattr(assistant_skills_lib, name))
 
-def test_error_handler_imports():
-    """Test error handler module imports."""
-    from assistant_skills_lib import (
-        APIError,
-        AuthenticationError,
-        NotFoundError,
-        RateLimitError,
-        handle_errors,
-        print_error,
-        ErrorContext,
-    )
-    assert issubclass(APIError, Exception)
-    assert issubclass(AuthenticationError, APIError)
-    assert issubclass(NotFoundError, APIError)
-    assert issubclass(RateLimitError, APIError)
-    assert callable(handle_errors)
-    assert callable(print_error)
-    assert ErrorContext is not None
 
-
-def test_template_engine_imports():
-    """Test template engine module imports."""
-    from assistant_skills_lib import (
-        load_template,
-        render_template,
-        list_placeholders,
-    )
-    assert callable(load_template)
-    assert callable(render_template)
-    assert callable(list_placeholders)
-
-
-def test_project_detector_imports():
-    """Test project detector module imports."""
-    from assistant_skills_lib import (
-        detect_project,
-        list_skills,
-        validate_structure,
-        get_project_stats,
-    )
-    assert callable(detect_project)
-    assert callable(list_skills)
-    assert callable(validate_structure)
-    assert callable(get_project_stats)
-
-
-def test_direct_module_imports():
+@pytest.mark.parametrize("module", [
+    "formatters",
+    "validators",
+    "cache",
+    "error_handler",
+    "template_engine",
+    "project_detector",
+])
+def test_direct_module_imports(module):
     """Test importing modules directly."""
-    from assistant_skills_lib import formatters
-    from assistant_skills_lib import validators
-    from assistant_skills_lib import cache
-    from assistant_skills_lib import error_handler
-    from assistant_skills_lib import template_engine
-    from assistant_skills_lib import project_detector
-
-    assert formatters is not None
-    assert validators is not None
-    assert cache is not None
-    assert error_handler is not None
-    assert template_engine is not None
-    assert project_detector is not None
+    assert importlib.import_module(f"assistant_skills_lib.{module}") is not None
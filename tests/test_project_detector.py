@@ -8,9 +8,35 @@ from assistant_skills_lib import (
     list_skills,
     validate_structure,
     get_project_stats,
+    get_shared_lib_modules,
 )
 
 
+@pytest.fixture
+def skills_project(tmp_path):
+    """A small project with two skills and a shared library."""
+    skills = tmp_path / ".claude" / "skills"
+    files = [
+        "demo-search/SKILL.md",
+        "demo-search/scripts/__init__.py",
+        "demo-search/scripts/search.py",
+        "demo-search/scripts/notes.txt",
+        "demo-search/tests/test_search.py",
+        "demo-search/tests/unit/test_query.py",
+        "demo-search/tests/conftest.py",
+        "demo-search/docs/guide.md",
+        "demo-search/docs/api/reference.md",
+        "demo-issues/scripts/create.py",
+        "shared/scripts/lib/__init__.py",
+        "shared/scripts/lib/client.py",
+    ]
+    for rel in files:
+        path = skills / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    return tmp_path
+
+
 class TestDetectProject:
     """Tests for detect_project function."""
 
@@ -19,18 +45,25 @@ class TestDetectProject:
         result = detect_project("/nonexistent/path")
         assert result is None
 
-    def test_detect_non_project_directory(self, tmp_path):
+    def test_detect_non_project_directory(self, empty_project_dir):
         """Test detection on non-project directory."""
-        result = detect_project(str(tmp_path))
+        result = detect_project(str(empty_project_dir))
         assert result is None
 
+    def test_detect_project_skills(self, skills_project):
+        """Test skills and topic prefix are detected, excluding shared."""
+        result = detect_project(str(skills_project))
+        assert sorted(result["skills"]) == ["demo-issues", "demo-search"]
+        assert result["topic_prefix"] == "demo"
+        assert result["has_shared_lib"] is True
+
 
 class TestListSkills:
     """Tests for list_skills function."""
 
-    def test_list_skills_empty_project(self, tmp_path):
+    def test_list_skills_empty_project(self, empty_project_dir):
         """Test listing skills in empty directory."""
-        result = list_skills(str(tmp_path))
+        result = list_skills(str(empty_project_dir))
         assert result == []
 
     def test_list_skills_nonexistent_path(self):
@@ -38,13 +71,28 @@ class TestListSkills:
         result = list_skills("/nonexistent/path")
         assert result == []
 
+    def test_list_skills_details(self, skills_project):
+        """Test skills are sorted and report their files."""
+        result = list_skills(str(skills_project))
+        assert [s["name"] for s in result] == ["demo-issues", "demo-search"]
+        issues, search = result
+        assert search["path"] == str(skills_project / ".claude" / "skills" / "demo-search")
+        assert search["has_skill_md"] and search["has_tests"]
+        assert search["scripts"] == ["search.py"]
+        assert not issues["has_skill_md"] and not issues["has_tests"]
+        assert issues["scripts"] == ["create.py"]
+
+    def test_shared_lib_modules(self, skills_project):
+        """Test shared library modules are listed without __init__."""
+        assert get_shared_lib_modules(str(skills_project)) == ["client"]
+
 
 class TestValidateStructure:
     """Tests for validate_structure function."""
 
-    def test_validate_empty_directory(self, tmp_path):
+    def test_validate_empty_directory(self, empty_project_dir):
         """Test validation of empty directory."""
-        result = validate_structure(str(tmp_path))
+        result = validate_structure(str(empty_project_dir))
         assert "valid" in result or "errors" in result
 
     def test_validate_nonexistent_path(self):
@@ -56,12 +104,17 @@ class TestValidateStructure:
 class TestGetProjectStats:
     """Tests for get_project_stats function."""
 
-    def test_stats_empty_directory(self, tmp_path):
+    def test_stats_empty_directory(self, empty_project_dir):
         """Test stats for empty directory."""
-        result = get_project_stats(str(tmp_path))
+        result = get_project_stats(str(empty_project_dir))
         assert isinstance(result, dict)
 
     def test_stats_nonexistent_path(self):
         """Test stats for nonexistent path."""
         result = get_project_stats("/nonexistent/path")
         assert isinstance(result, dict)
+
+    def test_stats_counts_nested_files(self, skills_project):
+        """Test tests and docs are counted recursively."""
+        result = get_project_stats(str(skills_project))
+        assert result == {"skills": 2, "scripts": 2, "tests": 2, "docs": 2}
@@ -1,11 +1,19 @@
 """Tests for template_engine module."""
 
+from pathlib import Path
+
 import pytest
 from assistant_skills_lib import (
     load_template,
     render_template,
     list_placeholders,
 )
+from assistant_skills_lib import template_engine
+from assistant_skills_lib.template_engine import (
+    validate_context,
+    get_template_dir,
+    list_template_files,
+)
 
 
 class TestListPlaceholders:
@@ -53,6 +61,19 @@ class TestRenderTemplate:
         with pytest.raises(Exception):  # Could be KeyError or custom exception
             render_template(template, {}, strict=True)
 
+    def test_missing_placeholders_strict_lists_each_once(self):
+        """Strict mode names every missing placeholder, sorted and deduplicated."""
+        template = "{{B}} {{A}} {{B}} {{NAME}}"
+        with pytest.raises(ValueError, match="Missing placeholder values: A, B$"):
+            render_template(template, {"NAME": "x"}, strict=True)
+
+    def test_repeat_render_with_different_context(self):
+        """Rendering the same template again uses the new values verbatim."""
+        template = "{{A}}-{{B}}-{{A}}"
+        assert render_template(template, {"A": "1", "B": "2"}) == "1-2-1"
+        assert render_template(template, {"A": "{{B}}", "B": r"\1"}) == r"{{B}}-\1-{{B}}"
+        assert render_template(template, {"A": "x"}, strict=False) == "x-{{B}}-x"
+
     def test_missing_placeholder_non_strict(self):
         """Test missing placeholder in non-strict mode."""
         template = "Hello {{NAME}}!"
@@ -66,8 +87,6 @@ class TestValidateContext:
 
     def test_valid_context(self):
         """Test validation with all placeholders provided."""
-        from assistant_skills_lib.template_engine import validate_context
-
         template = "Hello {{NAME}}, welcome to {{PROJECT}}!"
         context = {"NAME": "World", "PROJECT": "Test"}
         result = validate_context(template, context)
@@ -79,8 +98,6 @@ class TestValidateContext:
 
     def test_missing_placeholders(self):
         """Test validation with missing placeholders."""
-        from assistant_skills_lib.template_engine import validate_context
-
         template = "Hello {{NAME}}, welcome to {{PROJECT}}!"
         context = {"NAME": "World"}
         result = validate_context(template, context)
@@ -91,8 +108,6 @@ class TestValidateContext:
 
     def test_extra_context_keys(self):
         """Test validation reports extra unused keys."""
-        from assistant_skills_lib.template_engine import validate_context
-
         template = "Hello {{NAME}}!"
         context = {"NAME": "World", "UNUSED": "value"}
         result = validate_context(template, context)
@@ -102,8 +117,6 @@ class TestValidateContext:
 
     def test_empty_template(self):
         """Test validation with empty template."""
-        from assistant_skills_lib.template_engine import validate_context
-
         template = "No placeholders here"
         context = {"KEY": "value"}
         result = validate_context(template, context)
@@ -119,9 +132,6 @@ class TestGetTemplateDir:
 
     def test_returns_path(self):
         """Test that get_template_dir returns a Path object."""
-        from assistant_skills_lib.template_engine import get_template_dir
-        from pathlib import Path
-
         result = get_template_dir()
 
         assert isinstance(result, Path)
@@ -139,17 +149,17 @@ class TestLoadTemplate:
 
         assert result == "Hello {{NAME}}!"
 
-    def test_load_nonexistent_file(self, tmp_path):
+    def test_load_nonexistent_file(self, empty_project_dir):
         """Test loading a nonexistent file raises error."""
-        nonexistent = tmp_path / "nonexistent.md"
+        nonexistent = empty_project_dir / "nonexistent.md"
 
         with pytest.raises(FileNotFoundError):
             load_template(str(nonexistent))
 
-    def test_load_directory_raises_error(self, tmp_path):
+    def test_load_directory_raises_error(self, empty_project_dir):
         """Test loading a directory raises error."""
         with pytest.raises(ValueError):
-            load_template(str(tmp_path))
+            load_template(str(empty_project_dir))
 
     def test_load_with_unicode(self, tmp_path):
         """Test loading template with unicode content."""
@@ -167,16 +177,12 @@ class TestListTemplateFiles:
 
     def test_returns_list(self):
         """Test that list_template_files returns a list."""
-        from assistant_skills_lib.template_engine import list_template_files
-
         result = list_template_files()
 
         assert isinstance(result, list)
 
     def test_result_structure(self):
         """Test that results have expected structure."""
-        from assistant_skills_lib.template_engine import list_template_files
-
         result = list_template_files()
 
         # Even if empty, structure should be valid
@@ -187,11 +193,27 @@ class TestListTemplateFiles:
 
     def test_filter_by_category(self):
         """Test filtering by category."""
-        from assistant_skills_lib.template_engine import list_template_files
-
         # Filter by a category substring
         result = list_template_files(category="testing")
 
         # All results should contain the category filter
         for item in result:
             assert "testing" in item["category"] or len(result) == 0
+
+    def test_finds_nested_templates(self, tmp_path, monkeypatch):
+        """Test .md and .template files are found at any depth."""
+        for rel in ("04-testing/a.md", "04-testing/sub/b.template",
+                    "04-testing/sub/c.txt", "05-documentation/d.md"):
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        monkeypatch.setattr(template_engine, "get_template_dir", lambda: tmp_path)
+
+        result = template_engine.list_template_files()
+
+        assert [(t["category"], t["name"]) for t in result] == [
+            ("04-testing", "a.md"),
+            ("04-testing", "b.template"),
+            ("05-documentation", "d.md"),
+        ]
+        assert result[1]["path"] == str(tmp_path / "04-testing" / "sub" / "b.template")
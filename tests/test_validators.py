@@ -48,7 +48,9 @@ def test_validate_name_success(name, expected):
     ("invalid name", {}, "name can only contain letters, numbers"),
     ("long" * 20, {}, "name must be at most 64 characters"),
     ("a", {"min_length": 2}, "name must be at least 2 characters"),
-])
+    ("skill-name", {"allow_dashes": False}, "can only contain letters, numbers, underscores$"),
+    ("skill_name", {"allow_underscores": False}, "can only contain letters, numbers, dashes$"),
+], ids=["digit-start", "space", "too-long", "too-short", "no-dashes", "no-underscores"])
 def test_validate_name_failure(name, kwargs, error_msg):
     with pytest.raises(ValidationError, match=error_msg):
         validate_name(name, **kwargs)
@@ -67,7 +69,7 @@ def test_validate_topic_prefix_success(prefix, expected):
     ("1topic", "Topic prefix must be lowercase letters/numbers, starting with a letter"),
     ("topic-name", "Topic prefix must be lowercase letters/numbers"),
     ("long" * 10, "Topic prefix should be concise"),
-])
+], ids=["digit-start", "dash", "too-long"])
 def test_validate_topic_prefix_failure(prefix, error_msg):
     with pytest.raises(ValidationError, match=error_msg):
         validate_topic_prefix(prefix)
@@ -78,6 +80,15 @@ def test_validate_path_success(tmp_path):
     test_file.write_text("content")
     assert validate_path(test_file, must_exist=True) == test_file
 
+def test_validate_path_type_checks(tmp_path):
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("content")
+    assert validate_path(tmp_path, must_exist=True, must_be_dir=True) == tmp_path
+    assert validate_path(test_file, must_exist=True, must_be_file=True) == test_file
+    # Type checks only apply to paths that exist
+    missing = tmp_path / "missing.txt"
+    assert validate_path(missing, must_be_file=True) == missing
+
 def test_validate_path_create_parents(tmp_path):
     new_path = tmp_path / "a" / "b" / "file.txt"
     validated = validate_path(new_path, create_parents=True)
@@ -88,7 +99,7 @@ def test_validate_path_create_parents(tmp_path):
     ("nonexistent.txt", {"must_exist": True}, "path does not exist"),
     (__file__, {"must_be_dir": True}, "path is not a directory"),
     (os.path.dirname(__file__), {"must_be_file": True}, "path is not a file"),
-])
+], ids=["missing", "not-dir", "not-file"])
 def test_validate_path_failure(path, kwargs, error_msg):
     with pytest.raises(ValidationError, match=error_msg):
         validate_path(path, **kwargs)
@@ -102,6 +113,9 @@ def test_validate_path_failure(path, kwargs, error_msg):
     ("ftp://example.com", {"allowed_schemes": ["ftp", "http", "https"]}, "ftp://example.com"),
     # URLs without scheme get https:// auto-added
     ("example.com", {}, "https://example.com"),
+    ("HTTPS://example.com/path?q=1", {}, "HTTPS://example.com/path?q=1"),
+    ("https://user@api.atlassian.net:8443", {"allowed_domains": [".atlassian.net:8443"]}, "https://user@api.atlassian.net:8443"),
+    ("https://[::1]:8080/", {}, "https://[::1]:8080"),
 ])
 def test_validate_url_success(url, kwargs, expected):
     assert validate_url(url, **kwargs) == expected
@@ -111,6 +125,11 @@ def test_validate_url_success(url, kwargs, expected):
     ("ftp://example.com", {}, "URL must use one of: http, https"),
     ("http://example.com", {"require_https": True}, "URL must use HTTPS"),
     ("example.com", {"allowed_domains": [".test.com"]}, "URL must be from an allowed domain"),
+    ("https:///path", {}, "URL must include a host"),
+    ("https://[::1/", {}, "Invalid URL format"),
+    # CVE-2019-9636: netlocs that change meaning under NFKC normalization
+    ("https://example.com\uff03@bing.com", {}, "invalid characters under NFKC"),
+    ("https://user\u2100@example.com", {"allowed_domains": ["example.com"]}, "invalid characters under NFKC"),
 ])
 def test_validate_url_failure(url, kwargs, error_msg):
     with pytest.raises(ValidationError, match=error_msg):